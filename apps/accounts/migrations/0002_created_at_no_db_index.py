@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
@@ -1,3 +1,6 @@
+import asyncio
+import functools
+import json
 import os
 from dataclasses import dataclass, field
 from enum import Enum
@@ -13,6 +16,28 @@ from llama_index.llms.openai import OpenAI
 
 PROMPTS_DIR = Path(__file__).parent.parent / "genflows/prompts"
 
+# Shared Jinja2 environment rooted at `apps/genflows` so paths like
+# 'prompts/system/browser_snapshot.txt' can be resolved by {% include %}.
+# Compiled templates are cached by the environment across renders, and the
+# whitespace settings are pinned so the same inputs render byte-identical
+# prompts (keeps provider-side prompt caching effective).
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(str(PROMPTS_DIR.parent)),
+    autoescape=False,
+    auto_reload=False,
+    cache_size=400,
+    keep_trailing_newline=True,
+    trim_blocks=False,
+    lstrip_blocks=False,
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_prompt(path: str, mtime: float) -> str:
+    """Read a prompt file; cached per (path, mtime) so edits are picked up."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
 
 class AgentType(Enum):
     STR = "str"
@@ -46,10 +71,15 @@ class AgentModel:
     }
 
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def llm(cls, model: "LLMModel", temperature: float = 0.5) -> LLM:
+        """
+        Returns a client for the given model, reused across calls so that
+        connection pools and credentials are not rebuilt per agent run.
+        """
         if model in cls.OPENAI:
             return OpenAI(
-                model=model,
+                model=model.value,
                 temperature=temperature,
                 api_key=os.getenv("OPENAI_API_KEY"),
             )
@@ -95,31 +125,44 @@ class Agent:
         if self.verbose:
             print(system_prompt)
 
-        messages = [
-            ChatMessage(role="system", content=system_prompt),
-            *self.messages,
-        ]
-        is_chat = len(messages) > 1
-        resp = await llm.achat(messages) if is_chat else await llm.acomplete(system_prompt)
-        content = resp.message.content if is_chat else resp.text
+        # Converse/chat APIs need at least one non-system turn, so a bare prompt
+        # is sent as the user message (what acomplete did under the hood)
+        if self.messages:
+            messages = [ChatMessage(role="system", content=system_prompt), *self.messages]
+        else:
+            messages = [ChatMessage(role="user", content=system_prompt)]
+        resp = await llm.achat(messages)
+        content = resp.message.content
         if self.verbose:
             print(content)
         return await self.cast_response(content)
 
     async def cast_response(self, response: str) -> str:
-        method_name = f"cast_{self.type.value}"
-        cast_method = getattr(self, method_name)
-        return await cast_method(response)
+        return await self._CASTS[self.type](self, response)
 
     async def cast_str(self, response: str) -> str:
         return response
 
     async def cast_json(self, response: str) -> dict:
         json_str = response[response.find("{"): response.rfind("}") + 1]
-        return json_repair.loads(json_str.replace("\n", ""))
+        # Well-formed output is parsed by the C decoder; only fall back to
+        # the (pure Python) repair parser when the model emitted broken JSON
+        try:
+            return json.loads(json_str, strict=False)
+        except ValueError:
+            return json_repair.loads(json_str)
 
     async def cast_bool(self, response: str) -> bool:
-        return "true" in response.lower()
+        # Decide on the first word only, ignoring markdown/quote wrappers and punctuation around it
+        words = response.split(None, 1)
+        return bool(words) and words[0].strip("\"'`*.,:;!").lower() == "true"
+
+    # Cast method per AgentType, resolved once at class creation
+    _CASTS = {
+        AgentType.STR: cast_str,
+        AgentType.JSON: cast_json,
+        AgentType.BOOL: cast_bool,
+    }
 
     async def load_prompt(self) -> RichPromptTemplate:
         """
@@ -131,10 +174,10 @@ class Agent:
         Returns:
             RichPromptTemplate ready to use
         """
-        file_path = PROMPTS_DIR / f"{self.prompt_name}.txt"
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        file_path = str(PROMPTS_DIR / f"{self.prompt_name}.txt")
+        # stat/read run in a worker thread so a cold read never blocks the event loop
+        mtime = await asyncio.to_thread(os.path.getmtime, file_path)
+        content = await asyncio.to_thread(_read_prompt, file_path, mtime)
 
         return RichPromptTemplate(content)
 
@@ -142,14 +185,6 @@ class Agent:
         """Render the prompt using Jinja2 with a FileSystemLoader to support includes.
         This expands any Jinja tags (e.g., {% include %}) and returns the final string.
         """
-        file_path = PROMPTS_DIR / f"{self.prompt_name}.txt"
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Configure Jinja2 environment with loader pointing to `apps/genflows`
-        # so paths like 'prompts/system/browser_snapshot.txt' can be resolved.
-        base_dir = Path(__file__).parent.parent / "genflows"
-        env = Environment(loader=FileSystemLoader(str(base_dir)), autoescape=False)
-        template = env.from_string(content)
-        rendered = template.render(**(context or {}))
-        return rendered
+        # The first lookup loads and compiles from disk, so keep it off the event loop
+        template = await asyncio.to_thread(_JINJA_ENV.get_template, f"prompts/{self.prompt_name}.txt")
+        return template.render(**(context or {}))
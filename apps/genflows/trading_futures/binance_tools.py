@@ -1,3 +1,5 @@
+from django.utils import timezone
+
 from llama_index.core.tools import FunctionTool
 from tradings.models import TradingOperation
 
@@ -19,6 +21,9 @@ class BinanceTools:
         """
         self.binance_client = binance_client
         self.backtest_service = BacktestService(binance_client)
+        self._tools = None
+        # IDs of the operations recorded during this run, linked to the execution once it is saved
+        self.operation_ids = []
 
     def list_tools(self) -> list[FunctionTool]:
         """
@@ -27,6 +32,12 @@ class BinanceTools:
         Returns:
             list[FunctionTool]: List of LlamaIndex FunctionTools for trading.
         """
+        # Building a FunctionTool introspects the wrapped signature, so do it once per instance
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return self._tools
+
+    def _build_tools(self) -> list[FunctionTool]:
         return [
             FunctionTool.from_defaults(
                 fn=self._open_long_position,
@@ -139,41 +150,33 @@ class BinanceTools:
                     "Si win_rate < 50% o expectancy < 0, considera NO operar."
                 ),
             ),
-            FunctionTool.from_defaults(
-                fn=self._backtest_strategy,
-                name="backtest_strategy",
-                description=(
-                    "Simula cómo habría funcionado una estrategia de trading "
-                    "basándose en condiciones de mercado similares en el pasado.\n\n"
-                    "⚠️ USA ESTA HERRAMIENTA ANTES de abrir una posición para validar "
-                    "que las condiciones actuales históricamente han sido rentables.\n\n"
-                    "PARÁMETROS:\n"
-                    "- currency: Base currency (ej: 'BTC', 'ETH'). NO incluir 'USDT'.\n"
-                    "- direction: 'LONG' o 'SHORT'\n"
-                    "- current_rsi: RSI actual (del market data)\n"
-                    "- current_macd: MACD actual (del market data)\n"
-                    "- current_price: Precio actual\n"
-                    "- current_ema_9: EMA(9) actual\n"
-                    "- current_funding_rate: Funding rate actual (opcional)\n"
-                    "- lookback_days: Días de historia a analizar (default: 7)\n"
-                    "- stop_loss_pct: % de stop loss a simular (default: 2.0)\n"
-                    "- take_profit_pct: % de take profit a simular (default: 4.0)\n\n"
-                    "RETORNA métricas para ayudar en la decisión:\n"
-                    "- win_rate: % de trades ganadores\n"
-                    "- avg_profit_pct: Ganancia promedio por trade\n"
-                    "- expectancy: Ganancia esperada por trade\n"
-                    "- profit_factor: Ratio ganancias/pérdidas\n"
-                    "- similar_setups_found: Cuántas condiciones similares se encontraron\n\n"
-                    "EJEMPLO DE USO:\n"
-                    "Antes de abrir LONG en BTC, llamar:\n"
-                    "backtest_strategy(currency='BTC', direction='LONG', "
-                    "current_rsi=28.5, current_macd=-150.2, current_price=105000, "
-                    "current_ema_9=104500, stop_loss_pct=2.0, take_profit_pct=4.0)\n\n"
-                    "Si win_rate < 50% o expectancy < 0, considera NO operar."
-                ),
-            ),
         ]
 
+    def _start_operation(self, **fields) -> TradingOperation:
+        """
+        Record a PENDING operation before calling Binance and remember it for this run.
+
+        Args:
+            **fields: Column values for the new TradingOperation.
+
+        Returns:
+            TradingOperation: The created operation.
+        """
+        operation = TradingOperation.objects.create(status=TradingOperation.Status.PENDING, **fields)
+        self.operation_ids.append(operation.pk)
+        return operation
+
+    def _finish_operation(self, operation: TradingOperation, **fields) -> None:
+        """
+        Persist the outcome of an operation with a single UPDATE of the given columns.
+
+        Args:
+            operation (TradingOperation): The PENDING operation created before calling Binance.
+            **fields: Column values to write (status, result_data, order IDs, error_message).
+        """
+        # QuerySet.update() bypasses auto_now, so bump updated_at explicitly
+        TradingOperation.objects.filter(pk=operation.pk).update(updated_at=timezone.now(), **fields)
+
     def _open_long_position(
         self,
         currency: str,
@@ -208,14 +211,13 @@ class BinanceTools:
             ... )
         """
         # Create operation record
-        operation = TradingOperation.objects.create(
+        operation = self._start_operation(
             operation_type=TradingOperation.OperationType.OPEN_LONG,
             currency=currency,
             quantity=quantity,
             leverage=leverage,
             stop_loss_price=stop_loss_price,
             take_profit_price=take_profit_price,
-            status=TradingOperation.Status.PENDING,
         )
 
         try:
@@ -228,20 +230,20 @@ class BinanceTools:
             )
 
             # Update operation with success result
-            operation.status = TradingOperation.Status.SUCCESS
-            operation.result_data = result
-            operation.main_order_id = result.get("main_order_id")
-            operation.stop_loss_order_id = result.get("stop_loss_order_id")
-            operation.take_profit_order_id = result.get("take_profit_order_id")
-            operation.save()
+            self._finish_operation(
+                operation,
+                status=TradingOperation.Status.SUCCESS,
+                result_data=result,
+                main_order_id=result.get("main_order_id"),
+                stop_loss_order_id=result.get("stop_loss_order_id"),
+                take_profit_order_id=result.get("take_profit_order_id"),
+            )
 
             return result
 
         except Exception as e:
             # Update operation with error
-            operation.status = TradingOperation.Status.ERROR
-            operation.error_message = str(e)
-            operation.save()
+            self._finish_operation(operation, status=TradingOperation.Status.ERROR, error_message=str(e))
             raise e
 
     def _open_short_position(
@@ -278,14 +280,13 @@ class BinanceTools:
             ... )
         """
         # Create operation record
-        operation = TradingOperation.objects.create(
+        operation = self._start_operation(
             operation_type=TradingOperation.OperationType.OPEN_SHORT,
             currency=currency,
             quantity=quantity,
             leverage=leverage,
             stop_loss_price=stop_loss_price,
             take_profit_price=take_profit_price,
-            status=TradingOperation.Status.PENDING,
         )
 
         try:
@@ -298,20 +299,20 @@ class BinanceTools:
             )
 
             # Update operation with success result
-            operation.status = TradingOperation.Status.SUCCESS
-            operation.result_data = result
-            operation.main_order_id = result.get("main_order_id")
-            operation.stop_loss_order_id = result.get("stop_loss_order_id")
-            operation.take_profit_order_id = result.get("take_profit_order_id")
-            operation.save()
+            self._finish_operation(
+                operation,
+                status=TradingOperation.Status.SUCCESS,
+                result_data=result,
+                main_order_id=result.get("main_order_id"),
+                stop_loss_order_id=result.get("stop_loss_order_id"),
+                take_profit_order_id=result.get("take_profit_order_id"),
+            )
 
             return result
 
         except Exception as e:
             # Update operation with error
-            operation.status = TradingOperation.Status.ERROR
-            operation.error_message = str(e)
-            operation.save()
+            self._finish_operation(operation, status=TradingOperation.Status.ERROR, error_message=str(e))
             raise e
 
     def _close_position(self, currency: str) -> dict:
@@ -329,28 +330,27 @@ class BinanceTools:
             >>> _close_position(currency="BTC")  # Not "BTCUSDT"
         """
         # Create operation record
-        operation = TradingOperation.objects.create(
+        operation = self._start_operation(
             operation_type=TradingOperation.OperationType.CLOSE_POSITION,
             currency=currency,
-            status=TradingOperation.Status.PENDING,
         )
 
         try:
             result = self.binance_client.close_position(currency=currency)
 
             # Update operation with success result
-            operation.status = TradingOperation.Status.SUCCESS
-            operation.result_data = result
-            operation.main_order_id = result.get("orderId")
-            operation.save()
+            self._finish_operation(
+                operation,
+                status=TradingOperation.Status.SUCCESS,
+                result_data=result,
+                main_order_id=result.get("orderId"),
+            )
 
             return result
 
         except Exception as e:
             # Update operation with error
-            operation.status = TradingOperation.Status.ERROR
-            operation.error_message = str(e)
-            operation.save()
+            self._finish_operation(operation, status=TradingOperation.Status.ERROR, error_message=str(e))
             raise e
 
     def _backtest_strategy(
@@ -1,7 +1,8 @@
-import io
+import ast
+import functools
 import sys
 import traceback
-from contextlib import redirect_stdout, redirect_stderr
+from types import CodeType, MappingProxyType
 
 from llama_index.core.tools import FunctionTool
 
@@ -14,6 +15,169 @@ from decimal import Decimal
 from datetime import datetime, timedelta
 
 
+@functools.lru_cache(maxsize=256)
+def _compile(code: str) -> tuple[CodeType | None, tuple[str, int] | None, bool]:
+    """
+    Compile a snippet once; agents often resend identical calculation code.
+
+    Returns:
+        tuple: (code object, None, has_imports) on success or (None, (message, line number), False)
+            so invalid snippets are not re-parsed either. Only the message is cached, not the
+            SyntaxError, whose traceback would keep the frames of the call that raised it alive.
+    """
+    try:
+        tree = ast.parse(code, '<trading_calculation>', 'exec')
+        has_imports = any(isinstance(node, (ast.Import, ast.ImportFrom)) for node in ast.walk(tree))
+        return compile(tree, '<trading_calculation>', 'exec'), None, has_imports
+    except SyntaxError as e:
+        return None, (e.msg, e.lineno), False
+
+
+class _OutputCollector:
+    """Minimal file-like sink for captured stdout/stderr (appends chunks, joins once)."""
+
+    __slots__ = ("chunks",)
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, s: str) -> int:
+        self.chunks.append(s)
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return "".join(self.chunks)
+
+
+def _rsi(prices, n: int = 14) -> float:
+    """
+    Relative Strength Index using Wilder's smoothing.
+
+    Args:
+        prices: Sequence of closing prices (oldest first).
+        n: Lookback period.
+
+    Returns:
+        float: Latest RSI value (0-100).
+    """
+    delta = pd.Series(prices, dtype=float).diff().iloc[1:]
+    avg_gain = delta.clip(lower=0).ewm(alpha=1 / n, adjust=False).mean().iloc[-1]
+    avg_loss = (-delta.clip(upper=0)).ewm(alpha=1 / n, adjust=False).mean().iloc[-1]
+    if avg_loss == 0:
+        return 100.0
+    return float(100 - 100 / (1 + avg_gain / avg_loss))
+
+
+def _kelly_fraction(win_rate: float, avg_win: float, avg_loss: float) -> float:
+    """
+    Full Kelly fraction for a strategy with the given win rate and average win/loss.
+
+    Args:
+        win_rate: Probability of a winning trade (0-1).
+        avg_win: Average profit of winning trades.
+        avg_loss: Average loss of losing trades (positive number).
+
+    Returns:
+        float: Fraction of capital to risk (can be negative when the edge is negative),
+            or 0.0 when avg_win or avg_loss is zero and the win/loss ratio is undefined.
+    """
+    if avg_win == 0 or avg_loss == 0:
+        return 0.0
+    win_loss_ratio = avg_win / avg_loss
+    return (win_rate * win_loss_ratio - (1 - win_rate)) / win_loss_ratio
+
+
+def _sharpe(returns, risk_free_rate: float = 0.0, periods: int = 252) -> float:
+    """
+    Annualized Sharpe ratio of a return series.
+
+    Args:
+        returns: Sequence of periodic returns.
+        risk_free_rate: Risk-free return per period.
+        periods: Periods per year used to annualize.
+
+    Returns:
+        float: Annualized Sharpe ratio, or nan when the returns are empty or have no volatility.
+    """
+    excess = np.asarray(returns, dtype=float) - risk_free_rate
+    if excess.size == 0:
+        return math.nan
+    std = excess.std()
+    if std == 0:
+        return math.nan
+    return float(excess.mean() / std * math.sqrt(periods))
+
+
+def _sortino(returns, risk_free_rate: float = 0.0, periods: int = 252) -> float:
+    """
+    Annualized Sortino ratio of a return series (downside deviation only).
+
+    Args:
+        returns: Sequence of periodic returns.
+        risk_free_rate: Risk-free return per period.
+        periods: Periods per year used to annualize.
+
+    Returns:
+        float: Annualized Sortino ratio, or nan when the returns are empty or never fall
+            below the risk-free rate.
+    """
+    excess = np.asarray(returns, dtype=float) - risk_free_rate
+    if excess.size == 0:
+        return math.nan
+    downside = np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2))
+    if downside == 0:
+        return math.nan
+    return float(excess.mean() / downside * math.sqrt(periods))
+
+
+# Tool description sent with every agent turn, so keep it compact
+_EXECUTE_CODE_DESC = (
+    "⚠️ USE ONLY FOR COMPLEX MATHEMATICAL CALCULATIONS - NOT FOR DISPLAYING DATA ⚠️\n\n"
+    "This tool executes Python code for advanced mathematical computations that help in "
+    "trading decisions. DO NOT use this tool to format, print, or display data that is "
+    "already available in your context.\n\n"
+    "❌ WRONG USAGE (DO NOT DO THIS):\n"
+    "- Printing market data that's already given to you\n"
+    "- Formatting prices, indicators, or balance information\n"
+    "- Creating summary reports or analysis displays\n"
+    "- Repeating data that's already in your context\n\n"
+    "✅ CORRECT USAGE (ONLY use for these purposes):\n"
+    "- Complex position sizing calculations with multiple variables\n"
+    "- Advanced technical indicator calculations not provided in market_data\n"
+    "- Statistical analysis requiring numpy/pandas operations\n"
+    "- Risk management calculations with complex formulas\n"
+    "- Portfolio optimization or correlation analysis\n\n"
+    "AVAILABLE LIBRARIES (pre-imported):\n"
+    "- numpy (as 'np'): Arrays, linear algebra, advanced math\n"
+    "- pandas (as 'pd'): Data frames, time series analysis\n"
+    "- math, statistics: Standard mathematical functions\n"
+    "- Decimal: Precise decimal arithmetic\n"
+    "- datetime, timedelta: Date/time operations\n"
+    "- rsi(prices, n=14): Wilder RSI of a price sequence (use instead of a manual loop)\n"
+    "- kelly_fraction(win_rate, avg_win, avg_loss): Full Kelly fraction\n"
+    "- sharpe(returns, risk_free_rate=0.0, periods=252), "
+    "sortino(returns, risk_free_rate=0.0, periods=252): Annualized ratios\n\n"
+    "EXAMPLES (prefer the helpers above over re-deriving formulas):\n"
+    "- Half-Kelly with cap: print(f'{max(0, min(kelly_fraction(0.55, 200, 100) * 0.5, 0.25)):.2%}')\n"
+    "- Correlation: print(np.corrcoef(btc_returns, eth_returns)[0, 1])\n"
+    "- Sharpe: print(sharpe(np.array([0.02, 0.01, -0.01, 0.03, 0.015]), risk_free_rate=0.001))\n\n"
+    "CRITICAL RULES:\n"
+    "- Output results using print() - they will be captured\n"
+    "- If you just want to show data you already have, DON'T use this tool\n"
+    "- Only use when you need to CALCULATE something new and complex\n"
+    "- Code is sandboxed: no file I/O, network, or system commands\n"
+)
+
+
+_IMPORTS_NOT_ALLOWED_ERROR = (
+    "Import Error: imports are not allowed; use the pre-imported libraries "
+    "(np, pd, math, statistics, Decimal, datetime, timedelta) and helpers instead."
+)
+
+
 class PythonTools:
     """
     Wrapper class to expose Python code execution as a LlamaIndex FunctionTool.
@@ -76,6 +240,8 @@ class PythonTools:
             'False': False,
             'None': None,
         }
+        # Read-only view: snippets share this mapping, so they must not be able to alter it
+        self._safe_builtins = MappingProxyType(self._safe_builtins)
 
         # Pre-loaded libraries available in the execution environment
         self._available_libraries = {
@@ -88,7 +254,18 @@ class PythonTools:
             'Decimal': Decimal,
             'datetime': datetime,
             'timedelta': timedelta,
+            'rsi': _rsi,
+            'kelly_fraction': _kelly_fraction,
+            'sharpe': _sharpe,
+            'sortino': _sortino,
+        }
+
+        # Namespace template copied for each execution (builtins and libraries never change)
+        self._base_namespace = {
+            '__builtins__': self._safe_builtins,
+            **self._available_libraries,
         }
+        self._tools = None
 
     def list_tools(self) -> list[FunctionTool]:
         """
@@ -97,64 +274,17 @@ class PythonTools:
         Returns:
             list[FunctionTool]: List of LlamaIndex FunctionTools.
         """
+        # Building a FunctionTool introspects the wrapped signature, so do it once per instance
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return self._tools
+
+    def _build_tools(self) -> list[FunctionTool]:
         return [
             FunctionTool.from_defaults(
                 fn=self._execute_python_code,
                 name="execute_python_code",
-                description=(
-                    "⚠️ USE ONLY FOR COMPLEX MATHEMATICAL CALCULATIONS - NOT FOR DISPLAYING DATA ⚠️\n\n"
-                    "This tool executes Python code for advanced mathematical computations that help in "
-                    "trading decisions. DO NOT use this tool to format, print, or display data that is "
-                    "already available in your context.\n\n"
-                    "❌ WRONG USAGE (DO NOT DO THIS):\n"
-                    "- Printing market data that's already given to you\n"
-                    "- Formatting prices, indicators, or balance information\n"
-                    "- Creating summary reports or analysis displays\n"
-                    "- Repeating data that's already in your context\n\n"
-                    "✅ CORRECT USAGE (ONLY use for these purposes):\n"
-                    "- Complex position sizing calculations with multiple variables\n"
-                    "- Advanced technical indicator calculations not provided in market_data\n"
-                    "- Statistical analysis requiring numpy/pandas operations\n"
-                    "- Risk management calculations with complex formulas\n"
-                    "- Portfolio optimization or correlation analysis\n\n"
-                    "AVAILABLE LIBRARIES (pre-imported):\n"
-                    "- numpy (as 'np'): Arrays, linear algebra, advanced math\n"
-                    "- pandas (as 'pd'): Data frames, time series analysis\n"
-                    "- math, statistics: Standard mathematical functions\n"
-                    "- Decimal: Precise decimal arithmetic\n"
-                    "- datetime, timedelta: Date/time operations\n\n"
-                    "GOOD EXAMPLES:\n\n"
-                    "1. Calculate optimal position size with Kelly Criterion:\n"
-                    "   ```python\n"
-                    "   win_rate = 0.55\n"
-                    "   avg_win = 200\n"
-                    "   avg_loss = 100\n"
-                    "   win_loss_ratio = avg_win / avg_loss\n"
-                    "   kelly = (win_rate * win_loss_ratio - (1 - win_rate)) / win_loss_ratio\n"
-                    "   optimal_fraction = max(0, min(kelly * 0.5, 0.25))  # Half-Kelly with cap\n"
-                    "   print(f'Optimal position fraction: {optimal_fraction:.2%}')\n"
-                    "   ```\n\n"
-                    "2. Calculate correlation between two assets:\n"
-                    "   ```python\n"
-                    "   btc_returns = np.array([0.02, -0.01, 0.03, -0.02, 0.01])\n"
-                    "   eth_returns = np.array([0.03, -0.015, 0.025, -0.018, 0.012])\n"
-                    "   correlation = np.corrcoef(btc_returns, eth_returns)[0, 1]\n"
-                    "   print(f'BTC-ETH correlation: {correlation:.3f}')\n"
-                    "   ```\n\n"
-                    "3. Calculate Sharpe ratio for strategy evaluation:\n"
-                    "   ```python\n"
-                    "   returns = np.array([0.02, 0.01, -0.01, 0.03, 0.015])\n"
-                    "   risk_free_rate = 0.001\n"
-                    "   excess_returns = returns - risk_free_rate\n"
-                    "   sharpe = np.mean(excess_returns) / np.std(excess_returns) * np.sqrt(252)\n"
-                    "   print(f'Annualized Sharpe Ratio: {sharpe:.2f}')\n"
-                    "   ```\n\n"
-                    "CRITICAL RULES:\n"
-                    "- Output results using print() - they will be captured\n"
-                    "- If you just want to show data you already have, DON'T use this tool\n"
-                    "- Only use when you need to CALCULATE something new and complex\n"
-                    "- Code is sandboxed: no file I/O, network, or system commands\n"
-                ),
+                description=_EXECUTE_CODE_DESC,
             ),
         ]
 
@@ -172,14 +302,11 @@ class PythonTools:
                 - error (str): Error message if execution failed, empty string otherwise
         """
         # Create isolated namespace with safe builtins and libraries
-        execution_namespace = {
-            '__builtins__': self._safe_builtins,
-            **self._available_libraries,
-        }
+        execution_namespace = self._base_namespace.copy()
 
         # Capture stdout and stderr
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
+        stdout_capture = _OutputCollector()
+        stderr_capture = _OutputCollector()
 
         result = {
             "success": False,
@@ -187,24 +314,35 @@ class PythonTools:
             "error": "",
         }
 
-        try:
-            # Compile the code first to catch syntax errors
-            compiled_code = compile(code, '<trading_calculation>', 'exec')
+        # Compile the code first to catch syntax errors
+        compiled_code, syntax_error, has_imports = _compile(code)
+        if syntax_error is not None:
+            message, lineno = syntax_error
+            result["error"] = f"Syntax Error: {message} at line {lineno}"
+            return result
+        # The read-only builtins can't serve the import machinery (it fails with an interpreter SystemError)
+        if has_imports:
+            result["error"] = _IMPORTS_NOT_ALLOWED_ERROR
+            return result
 
+        try:
             # Execute with stdout/stderr capture
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+            saved_stdout, saved_stderr = sys.stdout, sys.stderr
+            sys.stdout, sys.stderr = stdout_capture, stderr_capture
+            try:
                 exec(compiled_code, execution_namespace)
+            finally:
+                sys.stdout, sys.stderr = saved_stdout, saved_stderr
 
             result["success"] = True
             result["output"] = stdout_capture.getvalue()
 
-        except SyntaxError as e:
-            result["error"] = f"Syntax Error: {e.msg} at line {e.lineno}"
         except NameError as e:
             result["error"] = f"Name Error: {str(e)}. Note: Only pre-imported libraries are available."
         except Exception as e:
-            # Get the traceback for debugging
-            tb = traceback.format_exc()
+            # Only report frames from the snippet itself, not the tool/library internals
+            frames = [f for f in traceback.extract_tb(e.__traceback__) if f.filename == '<trading_calculation>']
+            tb = "".join(traceback.format_list(frames) + traceback.format_exception_only(type(e), e))
             result["error"] = f"{type(e).__name__}: {str(e)}\n\nTraceback:\n{tb}"
 
         # Include any stderr output in the error field
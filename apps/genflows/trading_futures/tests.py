@@ -0,0 +1,80 @@
+"""
+Unit tests for the sandboxed Python execution tool.
+"""
+
+import math
+
+import pytest
+
+from apps.genflows.trading_futures.python_tools import PythonTools, _kelly_fraction, _sharpe, _sortino
+
+
+class TestPythonTools:
+    """Test suite for PythonTools._execute_python_code."""
+
+    @pytest.fixture(scope="class")
+    def python_tools(self):
+        return PythonTools()
+
+    def test_executes_with_preimported_libraries(self, python_tools):
+        result = python_tools._execute_python_code("print(np.mean([1, 2, 3]), math.sqrt(16))")
+
+        assert result == {"success": True, "output": "2.0 4.0\n", "error": ""}
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import os",
+            "from os import path",
+            "def f():\n    import subprocess\nprint(1)",
+        ],
+    )
+    def test_imports_are_rejected_with_clear_message(self, python_tools, code):
+        result = python_tools._execute_python_code(code)
+
+        assert result["success"] is False
+        assert result["output"] == ""
+        assert result["error"].startswith("Import Error: imports are not allowed")
+        assert "SystemError" not in result["error"]
+
+    def test_syntax_error_is_reported_on_every_call(self, python_tools):
+        first = python_tools._execute_python_code("x = (")
+        second = python_tools._execute_python_code("x = (")
+
+        assert first == second
+        assert first["error"] == "Syntax Error: '(' was never closed at line 1"
+
+
+class TestRiskHelpers:
+    """Test suite for the kelly_fraction/sharpe/sortino sandbox helpers."""
+
+    def test_kelly_fraction(self):
+        assert _kelly_fraction(0.55, 200, 100) == pytest.approx(0.325)
+
+    @pytest.mark.parametrize("avg_win, avg_loss", [(1, 0), (0, 1)])
+    def test_kelly_fraction_with_zero_average_is_zero(self, avg_win, avg_loss):
+        assert _kelly_fraction(0.5, avg_win, avg_loss) == 0.0
+
+    def test_sharpe_and_sortino(self):
+        returns = [0.02, -0.01, 0.03, -0.02]
+
+        assert _sharpe(returns, periods=1) == pytest.approx(0.005 / math.sqrt(0.000425))
+        assert _sortino(returns, periods=1) == pytest.approx(0.005 / math.sqrt(0.000125))
+
+    @pytest.mark.parametrize(
+        "helper, returns",
+        [
+            (_sharpe, [0.01, 0.01]),
+            (_sharpe, []),
+            (_sortino, [0.01, 0.02, 0.03]),
+            (_sortino, []),
+        ],
+    )
+    def test_undefined_ratio_is_nan_without_warning(self, helper, returns, recwarn):
+        assert math.isnan(helper(returns))
+        assert len(recwarn) == 0
+
+    def test_sandbox_output_has_no_server_paths(self):
+        result = PythonTools()._execute_python_code("print(sharpe([0.01, 0.01]), sortino([0.01, 0.02]))")
+
+        assert result == {"success": True, "output": "nan nan\n", "error": ""}
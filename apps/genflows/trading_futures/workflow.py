@@ -1,6 +1,8 @@
-import re
+import asyncio
+import io
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from asgiref.sync import sync_to_async
@@ -16,18 +18,15 @@ from apps.genflows.agent import Agent, LLMModel
 from apps.genflows.trading_futures.binance_tools import BinanceTools
 from apps.genflows.trading_futures.python_tools import PythonTools
 
-
-class CollectMarketDataEvent(Event):
-    """Event for collecting market data for a specific currency."""
-
-    currency: str
+# "Strategy for Next Execution" section of the agent's final response
+_STRATEGY_RE = re.compile(r"## Strategy for Next Execution.*?(?=\n##|\Z)", re.DOTALL | re.IGNORECASE)
 
 
-class AggregateDataEvent(Event):
-    """Event containing market data for a single currency."""
+class CollectMarketDataEvent(Event):
+    """Event for collecting market data for the requested currencies."""
 
-    currency: str
-    market_data: dict
+    currencies: list[str]
+    balance_info: dict
 
 
 class ExecuteTradeEvent(Event):
@@ -53,6 +52,7 @@ class TradingResult:
     agent_streaming_output: str = ""  # Full streaming output from agent
     strategy_for_next_execution: str = ""  # Extracted strategy for next execution
     system_prompt: str = ""  # Complete system prompt provided to agent
+    operation_ids: list = field(default_factory=list)  # TradingOperation IDs recorded during the run
 
 
 class TradingFuturesWorkflow(Workflow):
@@ -61,9 +61,8 @@ class TradingFuturesWorkflow(Workflow):
 
     This workflow:
     1. Checks futures account balance
-    2. Collects market data concurrently for multiple currencies
-    3. Aggregates open positions
-    4. Executes trading agent with all collected information
+    2. Collects market data for multiple currencies, open positions and daily PnL concurrently
+    3. Executes trading agent with all collected information
     """
 
     def __init__(self, *args, **kwargs):
@@ -92,10 +91,8 @@ class TradingFuturesWorkflow(Workflow):
         if not currencies:
             return StopEvent(result={"error": "No currencies provided"})
 
-        await ctx.store.set("currencies", currencies)
-
         # Get futures balance
-        balance_info = self.binance_client.get_futures_balance()
+        balance_info = await asyncio.to_thread(self.binance_client.get_futures_balance)
 
         # Check if there's any balance
         if balance_info["total_wallet_balance"] <= 0:
@@ -103,77 +100,56 @@ class TradingFuturesWorkflow(Workflow):
                 result={"error": "No balance available in futures account. Please deposit funds before trading."}
             )
 
-        await ctx.store.set("balance_info", balance_info)
-
         print(f"\n✓ Balance check passed: ${balance_info['total_wallet_balance']:.2f} available")
-        print(f"📊 Collecting market data for {len(currencies)} currencies...")
+        print(f"📊 Collecting market data for {len(currencies)} currencies, open positions and daily performance...")
 
-        # Send market data collection events for each currency
-        for currency in currencies:
-            ctx.send_event(CollectMarketDataEvent(currency=currency))
+        return CollectMarketDataEvent(currencies=currencies, balance_info=balance_info)
 
-    @step(num_workers=4)
-    async def collect_market_data(self, ctx: Context, ev: CollectMarketDataEvent) -> AggregateDataEvent:
+    def _fetch_market_data(self, currency: str) -> dict:
         """
-        Collect market data for a specific currency (runs concurrently).
+        Fetch market data for a single currency, returning an empty dict on error.
 
         Args:
-            ctx: Workflow context
-            ev: CollectMarketDataEvent with currency to analyze
+            currency: Base currency symbol (e.g., 'BTC')
 
         Returns:
-            AggregateDataEvent with market data
+            Market data dictionary, or {} if collection failed
         """
-        currency = ev.currency
         print(f"  → Fetching market data for {currency}...")
-
         try:
             market_data = self.binance_client.get_market_data(currency)
             print(f"  ✓ {currency} data collected (Price: ${market_data['current_price']:.2f})")
-            return AggregateDataEvent(currency=currency, market_data=market_data)
+            return market_data
         except Exception as e:
             print(f"  ✗ Error collecting data for {currency}: {e}")
-            # Return empty data on error
-            return AggregateDataEvent(currency=currency, market_data={})
+            return {}
 
     @step
-    async def aggregate_positions(self, ctx: Context, ev: AggregateDataEvent) -> ExecuteTradeEvent | None:
+    async def collect_market_data(self, ctx: Context, ev: CollectMarketDataEvent) -> ExecuteTradeEvent:
         """
-        Aggregate all market data and fetch open positions.
+        Collect market data for every currency, open positions and daily performance concurrently.
 
         Args:
             ctx: Workflow context
-            ev: AggregateDataEvent from market data collection
+            ev: CollectMarketDataEvent with currencies to analyze
 
         Returns:
-            ExecuteTradeEvent when all data is collected, None otherwise
+            ExecuteTradeEvent with all aggregated data
         """
-        currencies = await ctx.store.get("currencies")
-
-        # Collect all market data events
-        result = ctx.collect_events(ev, [AggregateDataEvent] * len(currencies))
-        if result is None:
-            return None
-
-        # Aggregate market data into a dictionary
-        market_data = {}
-        for event in result:
-            if event.market_data:  # Only include successful data collection
-                market_data[event.currency] = event.market_data
+        currencies = ev.currencies
+
+        # All Binance calls are blocking and independent of each other, so run
+        # them in worker threads at once instead of per-currency step workers
+        *results, open_positions, daily_pnl = await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_market_data, currency) for currency in currencies),
+            asyncio.to_thread(self.binance_client.get_all_open_positions),
+            asyncio.to_thread(self.binance_client.get_daily_pnl),
+        )
 
-        await ctx.store.set("market_data", market_data)
+        # Only include successful data collection
+        market_data = {currency: data for currency, data in zip(currencies, results) if data}
 
         print(f"\n✓ Market data aggregated for {len(market_data)} currencies")
-        print("📈 Fetching open positions and daily performance...")
-
-        # Get all open positions (now includes associated orders)
-        open_positions = self.binance_client.get_all_open_positions()
-        await ctx.store.set("open_positions", open_positions)
-
-        # Get daily performance metrics
-        daily_pnl = self.binance_client.get_daily_pnl()
-        await ctx.store.set("daily_pnl", daily_pnl)
-
         print(f"✓ Found {len(open_positions)} open position(s)")
         print(
             f"✓ Daily PnL: ${daily_pnl['total_daily_pnl']:.2f} "
@@ -182,12 +158,9 @@ class TradingFuturesWorkflow(Workflow):
             f"{daily_pnl['trade_count']} trades, {daily_pnl['win_rate']:.1f}% win rate)"
         )
 
-
-        balance_info = await ctx.store.get("balance_info")
-
         return ExecuteTradeEvent(
             currencies=currencies,
-            balance_info=balance_info,
+            balance_info=ev.balance_info,
             market_data=market_data,
             open_positions=open_positions,
             daily_pnl=daily_pnl,
@@ -213,9 +186,25 @@ class TradingFuturesWorkflow(Workflow):
 
         @sync_to_async
         def get_previous_execution():
-            return TradingWorkflowExecution.objects.filter(status=TradingWorkflowExecution.Status.SUCCESS).first()
+            # Only the strategy text and timestamp are used; skip loading the large JSON/text columns
+            return (
+                TradingWorkflowExecution.objects.filter(status=TradingWorkflowExecution.Status.SUCCESS)
+                .only("strategy_for_next_execution", "created_at")
+                .first()
+            )
+
+        mcp_client = BasicMCPClient(
+            os.getenv("MCP_TRENDRADAR_URL")
+        )
+        mcp_tool_spec = McpToolSpec(
+            client=mcp_client,
+        )
 
-        previous_execution = await get_previous_execution()
+        # The DB lookup and the MCP tool listing are independent, so overlap them
+        previous_execution, tools = await asyncio.gather(
+            get_previous_execution(),
+            mcp_tool_spec.to_tool_list_async(),
+        )
 
         previous_execution_strategy = ""
         last_execution_time = None
@@ -245,15 +234,7 @@ class TradingFuturesWorkflow(Workflow):
         # Render the prompt
         prompt_system = await agent.render_prompt(context=prompt_context)
 
-        # Create tools
-        mcp_client = BasicMCPClient(
-            os.getenv("MCP_TRENDRADAR_URL")
-        )
-        mcp_tool_spec = McpToolSpec(
-            client=mcp_client,
-        )
-        tools = await mcp_tool_spec.to_tool_list_async()
-
+        # Built per run: BinanceTools collects the operation IDs recorded during this run only
         binance_tools = BinanceTools(self.binance_client)
         tools += binance_tools.list_tools()
 
@@ -279,27 +260,26 @@ class TradingFuturesWorkflow(Workflow):
         )
 
         # Capture streaming output
-        streaming_response = []
+        streaming_buffer = io.StringIO()
         async for event in handler.stream_events():
             if isinstance(event, AgentStream):
                 # Send each chunk via WebSocket
                 chunk = event.delta or ""
                 if chunk:
-                    streaming_response.append(chunk)
-                    print(chunk, end="", flush=True)
+                    streaming_buffer.write(chunk)
+                    # Flush per line rather than per token to avoid a write syscall for every delta
+                    print(chunk, end="", flush="\n" in chunk)
 
         # Get final result
         final_result = await handler
         agent_response = final_result.response.content
 
-        # Combine streaming chunks into full response
-        full_streaming_output = "".join(streaming_response)
+        full_streaming_output = streaming_buffer.getvalue()
 
         # Extract "Strategy for Next Execution" section from agent response
         strategy_for_next_execution = ""
         # Try to find the strategy section in the response
-        strategy_pattern = r"## Strategy for Next Execution.*?(?=\n##|\Z)"
-        strategy_match = re.search(strategy_pattern, agent_response, re.DOTALL | re.IGNORECASE)
+        strategy_match = _STRATEGY_RE.search(agent_response)
         if strategy_match:
             strategy_for_next_execution = strategy_match.group(0).strip()
             print(f"\n\n✓ Extracted strategy for next execution ({len(strategy_for_next_execution)} chars)")
@@ -321,5 +301,6 @@ class TradingFuturesWorkflow(Workflow):
                 agent_streaming_output=full_streaming_output,
                 strategy_for_next_execution=strategy_for_next_execution,
                 system_prompt=prompt_system,
+                operation_ids=binance_tools.operation_ids,
             )
         )
@@ -9,6 +9,18 @@ from apscheduler.schedulers.background import BackgroundScheduler
 logger = logging.getLogger(__name__)
 
 
+def run_trading_workflow():
+    """
+    Scheduler entry point that imports the workflow on first run.
+
+    The workflow pulls in llama-index, pandas and the Binance client, so importing
+    it lazily keeps that cost out of Django startup (it is paid in the scheduler thread).
+    """
+    from apps.tradings.scheduler import run_trading_workflow as _run_trading_workflow
+
+    _run_trading_workflow()
+
+
 class TradingsConfig(AppConfig):
     name = "tradings"
     label = "tradings"  # Django uses this as the app label
@@ -29,8 +41,6 @@ class TradingsConfig(AppConfig):
         # if settings.DEBUG:
         #     return
 
-        from apps.tradings.scheduler import run_trading_workflow
-
         scheduler = BackgroundScheduler()
 
         # Schedule the trading workflow to run every custom minutes
@@ -0,0 +1,62 @@
+# Generated manually for currencies ArrayField
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Convert TradingWorkflowExecution.currencies from jsonb to varchar[] with a GIN index.
+
+    Postgres does not allow subqueries in ALTER COLUMN ... USING, so the values are
+    copied through a temporary column instead.
+    """
+
+    dependencies = [
+        ("tradings", "0005_remove_tradingworkflowexecution_execution_frequency_minutes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tradingworkflowexecution",
+            name="currencies_array",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=16), default=list, blank=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tradingworkflowexecution",
+            name="currencies",
+            field=models.JSONField(null=True, help_text="List of currencies analyzed (e.g., ['BTC', 'ETH'])"),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE tradings_tradingworkflowexecution "
+                "SET currencies_array = ARRAY(SELECT jsonb_array_elements_text(currencies)) "
+                "WHERE jsonb_typeof(currencies) = 'array';"
+            ),
+            reverse_sql="UPDATE tradings_tradingworkflowexecution SET currencies = to_jsonb(currencies_array);",
+        ),
+        migrations.RemoveField(
+            model_name="tradingworkflowexecution",
+            name="currencies",
+        ),
+        migrations.RenameField(
+            model_name="tradingworkflowexecution",
+            old_name="currencies_array",
+            new_name="currencies",
+        ),
+        migrations.AlterField(
+            model_name="tradingworkflowexecution",
+            name="currencies",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=16),
+                help_text="List of currencies analyzed (e.g., ['BTC', 'ETH'])",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tradingworkflowexecution",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["currencies"], name="tradings_twe_currencies_gin"),
+        ),
+    ]
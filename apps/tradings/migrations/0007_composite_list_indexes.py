@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tradings', '0006_currencies_array_field'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tradingoperation',
+            name='tradings_tr_created_7964c9_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tradingoperation',
+            name='tradings_tr_currenc_850b8e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tradingworkflowexecution',
+            name='tradings_tr_created_bb3761_idx',
+        ),
+        migrations.AddIndex(
+            model_name='tradingoperation',
+            index=models.Index(fields=['currency', 'status', '-created_at'], name='top_cur_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradingoperation',
+            index=models.Index(fields=['operation_type', '-created_at'], name='top_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradingworkflowexecution',
+            index=models.Index(fields=['status', '-created_at'], include=('execution_duration',), name='twe_status_created_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tradings', '0007_composite_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tradingoperation',
+            index=models.Index(fields=['-created_at', '-id'], name='top_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradingworkflowexecution',
+            index=models.Index(fields=['-created_at', '-id'], name='twe_created_id_idx'),
+        ),
+    ]
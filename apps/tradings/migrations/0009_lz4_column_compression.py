@@ -0,0 +1,64 @@
+# Generated manually for lz4 TOAST compression on large execution columns
+
+from django.db import migrations
+
+LARGE_COLUMNS = [
+    "balance_info",
+    "market_data",
+    "open_positions",
+    "daily_pnl",
+    "system_prompt",
+    "agent_streaming_output",
+]
+
+
+def _set_compression(method):
+    """
+    Build a DO block that switches the columns to ``method``, or does nothing when the server can't.
+
+    Column compression needs Postgres 14+, and lz4 is only available when the server was built
+    with it. Setting default_toast_compression to lz4 fails on such builds, which is used as the
+    probe. The statements run through EXECUTE so older servers never parse SET COMPRESSION.
+    """
+    alters = "\n    ".join(
+        f"EXECUTE 'ALTER TABLE tradings_tradingworkflowexecution ALTER COLUMN {column} SET COMPRESSION {method}';"
+        for column in LARGE_COLUMNS
+    )
+    return f"""
+DO $$
+DECLARE
+    previous_compression text := current_setting('default_toast_compression', true);
+BEGIN
+    IF current_setting('server_version_num')::int < 140000 THEN
+        RAISE NOTICE 'Column compression needs Postgres 14+, skipping';
+        RETURN;
+    END IF;
+    BEGIN
+        PERFORM set_config('default_toast_compression', 'lz4', true);
+    EXCEPTION WHEN invalid_parameter_value OR feature_not_supported THEN
+        RAISE NOTICE 'Postgres was built without lz4, skipping';
+        RETURN;
+    END;
+    PERFORM set_config('default_toast_compression', previous_compression, true);
+    {alters}
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+    """
+    Use lz4 instead of pglz when Postgres compresses (TOASTs) the large execution columns.
+
+    lz4 compresses and decompresses much faster than pglz at a similar ratio. Only values
+    written after this migration use it; existing rows keep their pglz-compressed data.
+    Servers older than Postgres 14 or built without lz4 are left unchanged.
+    """
+
+    dependencies = [
+        ("tradings", "0008_created_id_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=_set_compression("lz4"), reverse_sql=_set_compression("DEFAULT")),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:11
+
+import core.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tradings', '0009_lz4_column_compression'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tradingoperation',
+            name='result_data',
+            field=models.JSONField(blank=True, decoder=core.encoders.ORJSONDecoder, default=dict, encoder=core.encoders.ORJSONEncoder, help_text='Full response from Binance API'),
+        ),
+        migrations.AlterField(
+            model_name='tradingworkflowexecution',
+            name='agent_actions_taken',
+            field=models.JSONField(blank=True, decoder=core.encoders.ORJSONDecoder, default=list, encoder=core.encoders.ORJSONEncoder, help_text='Structured list of actions taken by the agent'),
+        ),
+        migrations.AlterField(
+            model_name='tradingworkflowexecution',
+            name='balance_info',
+            field=models.JSONField(decoder=core.encoders.ORJSONDecoder, encoder=core.encoders.ORJSONEncoder, help_text='Complete balance snapshot including total, available, and unrealized PnL'),
+        ),
+        migrations.AlterField(
+            model_name='tradingworkflowexecution',
+            name='daily_pnl',
+            field=models.JSONField(decoder=core.encoders.ORJSONDecoder, encoder=core.encoders.ORJSONEncoder, help_text='Daily performance metrics: PnL, trade count, win rate'),
+        ),
+        migrations.AlterField(
+            model_name='tradingworkflowexecution',
+            name='market_data',
+            field=models.JSONField(decoder=core.encoders.ORJSONDecoder, encoder=core.encoders.ORJSONEncoder, help_text='Market data for each currency including price, indicators, OI, and funding rate'),
+        ),
+        migrations.AlterField(
+            model_name='tradingworkflowexecution',
+            name='open_positions',
+            field=models.JSONField(decoder=core.encoders.ORJSONDecoder, default=list, encoder=core.encoders.ORJSONEncoder, help_text='All open positions with associated orders and risk metrics'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tradings', '0010_orjson_json_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tradingworkflowexecution',
+            name='available_balance',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tradingworkflowexecution',
+            name='daily_realized_pnl',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tradingworkflowexecution',
+            name='total_daily_pnl',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tradingworkflowexecution',
+            name='total_unrealized_pnl',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tradingworkflowexecution',
+            name='total_wallet_balance',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tradingworkflowexecution',
+            name='trade_count',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tradingworkflowexecution',
+            name='win_rate',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE tradings_tradingworkflowexecution SET
+                    total_wallet_balance = (balance_info->>'total_wallet_balance')::double precision,
+                    available_balance = (balance_info->>'available_balance')::double precision,
+                    total_unrealized_pnl = (balance_info->>'total_unrealized_pnl')::double precision,
+                    total_daily_pnl = (daily_pnl->>'total_daily_pnl')::double precision,
+                    daily_realized_pnl = (daily_pnl->>'daily_realized_pnl')::double precision,
+                    trade_count = (daily_pnl->>'trade_count')::integer,
+                    win_rate = (daily_pnl->>'win_rate')::double precision;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tradings', '0011_execution_metric_columns'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tradingoperation',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='tradingworkflowexecution',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
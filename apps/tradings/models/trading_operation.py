@@ -2,6 +2,7 @@ import uuid
 
 from django.db import models
 
+from core.encoders import ORJSONDecoder, ORJSONEncoder
 from core.models import TimeStampedModel
 
 
@@ -51,7 +52,13 @@ class TradingOperation(TimeStampedModel):
     take_profit_order_id = models.CharField(max_length=100, null=True, blank=True)
 
     # Results
-    result_data = models.JSONField(default=dict, blank=True, help_text="Full response from Binance API")
+    result_data = models.JSONField(
+        encoder=ORJSONEncoder,
+        decoder=ORJSONDecoder,
+        default=dict,
+        blank=True,
+        help_text="Full response from Binance API",
+    )
     error_message = models.TextField(blank=True)
 
     class Meta:
@@ -60,8 +67,9 @@ class TradingOperation(TimeStampedModel):
         verbose_name = "Trading Operation"
         verbose_name_plural = "Trading Operations"
         indexes = [
-            models.Index(fields=["-created_at", "operation_type"]),
-            models.Index(fields=["currency", "status"]),
+            models.Index(fields=["-created_at", "-id"], name="top_created_id_idx"),
+            models.Index(fields=["currency", "status", "-created_at"], name="top_cur_status_created_idx"),
+            models.Index(fields=["operation_type", "-created_at"], name="top_type_created_idx"),
         ]
 
     def __str__(self):
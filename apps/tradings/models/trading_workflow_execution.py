@@ -3,10 +3,16 @@
 import traceback
 import uuid
 
-from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models, transaction
+from django.utils import timezone
 
+from core.encoders import ORJSONDecoder, ORJSONEncoder
 from core.models import TimeStampedModel
 
+from .trading_operation import TradingOperation
+
 
 class TradingWorkflowExecution(TimeStampedModel):
     """
@@ -34,25 +40,46 @@ class TradingWorkflowExecution(TimeStampedModel):
     execution_duration = models.FloatField(null=True, blank=True, help_text="Execution time in seconds")
 
     # Workflow Input
-    currencies = models.JSONField(help_text="List of currencies analyzed (e.g., ['BTC', 'ETH'])")
+    currencies = ArrayField(
+        models.CharField(max_length=16), help_text="List of currencies analyzed (e.g., ['BTC', 'ETH'])"
+    )
 
     # Balance Information
     balance_info = models.JSONField(
+        encoder=ORJSONEncoder,
+        decoder=ORJSONDecoder,
         help_text="Complete balance snapshot including total, available, and unrealized PnL"
     )
 
     # Market Data
     market_data = models.JSONField(
+        encoder=ORJSONEncoder,
+        decoder=ORJSONDecoder,
         help_text="Market data for each currency including price, indicators, OI, and funding rate"
     )
 
     # Open Positions
     open_positions = models.JSONField(
+        encoder=ORJSONEncoder,
+        decoder=ORJSONDecoder,
         default=list, help_text="All open positions with associated orders and risk metrics"
     )
 
     # Daily Performance
-    daily_pnl = models.JSONField(help_text="Daily performance metrics: PnL, trade count, win rate")
+    daily_pnl = models.JSONField(
+        encoder=ORJSONEncoder,
+        decoder=ORJSONDecoder,
+        help_text="Daily performance metrics: PnL, trade count, win rate",
+    )
+
+    # Key metrics copied out of balance_info/daily_pnl so lists and statistics read plain columns
+    total_wallet_balance = models.FloatField(null=True, blank=True)
+    available_balance = models.FloatField(null=True, blank=True)
+    total_unrealized_pnl = models.FloatField(null=True, blank=True)
+    total_daily_pnl = models.FloatField(null=True, blank=True)
+    daily_realized_pnl = models.FloatField(null=True, blank=True)
+    trade_count = models.IntegerField(null=True, blank=True)
+    win_rate = models.FloatField(null=True, blank=True)
 
     # Agent Response
     system_prompt = models.TextField(
@@ -63,6 +90,8 @@ class TradingWorkflowExecution(TimeStampedModel):
         blank=True, help_text="Complete streaming output from the agent during execution"
     )
     agent_actions_taken = models.JSONField(
+        encoder=ORJSONEncoder,
+        decoder=ORJSONDecoder,
         default=list, blank=True, help_text="Structured list of actions taken by the agent"
     )
 
@@ -81,7 +110,11 @@ class TradingWorkflowExecution(TimeStampedModel):
         verbose_name = "Trading Workflow Execution"
         verbose_name_plural = "Trading Workflow Executions"
         indexes = [
-            models.Index(fields=["-created_at", "status"]),
+            models.Index(fields=["-created_at", "-id"], name="twe_created_id_idx"),
+            models.Index(
+                fields=["status", "-created_at"], name="twe_status_created_idx", include=["execution_duration"]
+            ),
+            GinIndex(fields=["currencies"], name="tradings_twe_currencies_gin"),
         ]
 
     def __str__(self):
@@ -114,34 +147,55 @@ class TradingWorkflowExecution(TimeStampedModel):
             agent_response=result.agent_response,
             agent_streaming_output=result.agent_streaming_output,
             strategy_for_next_execution=result.strategy_for_next_execution,
+            total_wallet_balance=result.balance_info.get("total_wallet_balance"),
+            available_balance=result.balance_info.get("available_balance"),
+            total_unrealized_pnl=result.balance_info.get("total_unrealized_pnl"),
+            total_daily_pnl=result.daily_pnl.get("total_daily_pnl"),
+            daily_realized_pnl=result.daily_pnl.get("daily_realized_pnl"),
+            trade_count=result.daily_pnl.get("trade_count"),
+            win_rate=result.daily_pnl.get("win_rate"),
         )
 
         if error:
             execution.error_message = str(error)
             execution.error_traceback = traceback.format_exc()
 
-        execution.save()
+        with transaction.atomic():
+            execution.save()
+            # Operations are recorded while the agent runs; attach them with a single UPDATE
+            # (QuerySet.update() bypasses auto_now, so bump updated_at explicitly)
+            if result.operation_ids:
+                TradingOperation.objects.filter(pk__in=result.operation_ids).update(
+                    workflow_execution=execution, updated_at=timezone.now()
+                )
         return execution
 
     def get_summary(self) -> dict:
         """
         Get a human-readable summary of the execution.
 
+        Reads the metric columns, so it doesn't need the JSON fields loaded. List querysets can
+        annotate ``open_positions_count`` to avoid loading open_positions as well.
+
         Returns:
             dict: Summary with key metrics
         """
+        open_positions_count = getattr(self, "open_positions_count", None)
+        if open_positions_count is None:
+            open_positions_count = len(self.open_positions)
+
         return {
             "execution_id": str(self.id),
             "timestamp": self.created_at.isoformat(),
             "status": self.status,
             "duration": f"{self.execution_duration:.2f}s" if self.execution_duration else "N/A",
             "currencies": self.currencies,
-            "total_balance": self.balance_info.get("total_wallet_balance", 0),
-            "available_balance": self.balance_info.get("available_balance", 0),
-            "daily_pnl": self.daily_pnl.get("total_daily_pnl", 0),
-            "trade_count": self.daily_pnl.get("trade_count", 0),
-            "win_rate": self.daily_pnl.get("win_rate", 0),
-            "open_positions_count": len(self.open_positions),
+            "total_balance": self.total_wallet_balance or 0,
+            "available_balance": self.available_balance or 0,
+            "daily_pnl": self.total_daily_pnl or 0,
+            "trade_count": self.trade_count or 0,
+            "win_rate": self.win_rate or 0,
+            "open_positions_count": open_positions_count,
             "has_error": bool(self.error_message),
         }
 
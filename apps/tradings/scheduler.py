@@ -1,19 +1,26 @@
 import asyncio
 import logging
+import threading
 import time
 
-import nest_asyncio
+from django.db import close_old_connections
+
 from langfuse import get_client
 from openinference.instrumentation.llama_index import LlamaIndexInstrumentor
 from tradings.models import TradingWorkflowExecution
 
 from apps.genflows.trading_futures.workflow import TradingFuturesWorkflow
 
-# Apply nest_asyncio to allow nested event loops
-nest_asyncio.apply()
-
 logger = logging.getLogger(__name__)
 
+# Instrumentation is process-wide, so it is installed once rather than on every run
+LlamaIndexInstrumentor().instrument()
+
+# Long-lived event loop shared by every scheduled run, so each tick reuses the loop
+# (and the HTTP/MCP clients bound to it) instead of creating and tearing one down
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name="trading-workflow-loop", daemon=True).start()
+
 
 async def execute_workflow():
     """
@@ -21,7 +28,6 @@ async def execute_workflow():
     The workflow's .run() method is synchronous and schedules tasks using
     asyncio.create_task(), so it must be invoked from within a running loop.
     """
-    LlamaIndexInstrumentor().instrument()
     langfuse = get_client()
     trace_id = langfuse.create_trace_id()
     # pylint: disable=not-context-manager
@@ -45,13 +51,16 @@ def run_trading_workflow():
     This function runs every minute via APScheduler.
     """
 
+    # Scheduler runs are outside the request cycle, so expire stale persistent connections here
+    close_old_connections()
+
     start_time = time.time()
     result = None
     error = None
 
     try:
-        # Create and run the workflow within a running event loop
-        result = asyncio.run(execute_workflow())
+        # Run the workflow on the shared event loop; the workflow enforces its own timeout
+        result = asyncio.run_coroutine_threadsafe(execute_workflow(), _loop).result()
 
     except Exception as e:
         error = e
@@ -89,4 +98,5 @@ def run_trading_workflow():
         except Exception as db_error:
             logger.error(f"❌ Failed to save execution to database: {db_error}", exc_info=True)
 
+        close_old_connections()
         logger.info("✅ Trading workflow execution finished")
@@ -15,7 +15,7 @@ class TradingOperationSerializer(serializers.ModelSerializer):
     # Read-only fields for better display
     operation_type_display = serializers.CharField(source="get_operation_type_display", read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
-    workflow_execution_id = serializers.UUIDField(source="workflow_execution.id", read_only=True, allow_null=True)
+    workflow_execution_id = serializers.UUIDField(read_only=True, allow_null=True)
 
     class Meta:
         model = TradingOperation
@@ -67,7 +67,7 @@ class TradingOperationListSerializer(serializers.ModelSerializer):
 
     operation_type_display = serializers.CharField(source="get_operation_type_display", read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
-    workflow_execution_id = serializers.UUIDField(source="workflow_execution.id", read_only=True, allow_null=True)
+    workflow_execution_id = serializers.UUIDField(read_only=True, allow_null=True)
 
     class Meta:
         model = TradingOperation
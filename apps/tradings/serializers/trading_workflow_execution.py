@@ -9,7 +9,8 @@ class TradingWorkflowExecutionSerializer(serializers.ModelSerializer):
     Serializer for TradingWorkflowExecution model.
 
     Provides comprehensive serialization of workflow execution data including
-    balance, market data, positions, and agent responses.
+    balance, market data, positions, and agent responses. The raw agent streaming
+    output and error traceback are served separately by the raw_output action.
     """
 
     # Read-only computed fields
@@ -37,13 +38,11 @@ class TradingWorkflowExecutionSerializer(serializers.ModelSerializer):
             # Agent data
             "system_prompt",
             "agent_response",
-            "agent_streaming_output",
             "agent_actions_taken",
             # Temporal context
             "strategy_for_next_execution",
             # Error handling
             "error_message",
-            "error_traceback",
             # Computed fields
             "summary",
             "balance_summary",
@@ -76,7 +75,8 @@ class TradingWorkflowExecutionListSerializer(serializers.ModelSerializer):
     Lightweight serializer for list views.
 
     Excludes heavy fields like streaming output and tracebacks
-    for better performance in list endpoints.
+    for better performance in list endpoints. The summary comes from the metric
+    columns and the ``open_positions_count`` annotation added by the list queryset.
     """
 
     summary = serializers.SerializerMethodField()
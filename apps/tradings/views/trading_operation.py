@@ -1,5 +1,7 @@
 """Trading Operation Views"""
 
+from django.db.models import Count, Q
+
 from django_filters import rest_framework as filters
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -8,6 +10,8 @@ from rest_framework.response import Response
 from tradings.models import TradingOperation
 from tradings.serializers import TradingOperationListSerializer, TradingOperationSerializer
 
+from core.paginators import LiteCursorPagination
+
 
 class TradingOperationFilter(filters.FilterSet):
     """
@@ -84,11 +88,19 @@ class TradingOperationViewSet(viewsets.ReadOnlyModelViewSet):
     - GET /api/tradings/operations/?workflow_execution=550e8400-e29b-41d4-a716-446655440000
     """
 
-    queryset = TradingOperation.objects.select_related("workflow_execution").all()
+    queryset = TradingOperation.objects.all()
     permission_classes = [AllowAny]
     filterset_class = TradingOperationFilter
     ordering_fields = ["created_at", "operation_type", "status", "currency"]
-    ordering = ["-created_at"]
+    ordering = ["-created_at", "-id"]
+    pagination_class = LiteCursorPagination
+
+    def get_queryset(self):
+        """Skip the raw Binance response (result_data) when listing."""
+        queryset = super().get_queryset()
+        if self.action == "list":
+            return queryset.defer("result_data")
+        return queryset
 
     def get_serializer_class(self):
         """Use lightweight serializer for list, full serializer for detail."""
@@ -109,32 +121,33 @@ class TradingOperationViewSet(viewsets.ReadOnlyModelViewSet):
         """
         queryset = self.filter_queryset(self.get_queryset())
 
-        total_count = queryset.count()
-        success_count = queryset.filter(status=TradingOperation.Status.SUCCESS).count()
-        error_count = queryset.filter(status=TradingOperation.Status.ERROR).count()
-        pending_count = queryset.filter(status=TradingOperation.Status.PENDING).count()
-
-        # Count by operation type
-        open_long_count = queryset.filter(operation_type=TradingOperation.OperationType.OPEN_LONG).count()
-        open_short_count = queryset.filter(operation_type=TradingOperation.OperationType.OPEN_SHORT).count()
-        close_position_count = queryset.filter(operation_type=TradingOperation.OperationType.CLOSE_POSITION).count()
+        # Status and operation type breakdowns in a single aggregate query
+        stats = queryset.order_by().aggregate(
+            total_count=Count("id"),
+            success_count=Count("id", filter=Q(status=TradingOperation.Status.SUCCESS)),
+            error_count=Count("id", filter=Q(status=TradingOperation.Status.ERROR)),
+            pending_count=Count("id", filter=Q(status=TradingOperation.Status.PENDING)),
+            open_long_count=Count("id", filter=Q(operation_type=TradingOperation.OperationType.OPEN_LONG)),
+            open_short_count=Count("id", filter=Q(operation_type=TradingOperation.OperationType.OPEN_SHORT)),
+            close_position_count=Count("id", filter=Q(operation_type=TradingOperation.OperationType.CLOSE_POSITION)),
+        )
+        total_count = stats["total_count"]
+        success_count = stats["success_count"]
 
         # Most traded currencies
-        from django.db.models import Count
-
         top_currencies = list(queryset.values("currency").annotate(count=Count("currency")).order_by("-count")[:5])
 
         return Response(
             {
                 "total_operations": total_count,
                 "success_count": success_count,
-                "error_count": error_count,
-                "pending_count": pending_count,
+                "error_count": stats["error_count"],
+                "pending_count": stats["pending_count"],
                 "success_rate": (success_count / total_count * 100) if total_count > 0 else 0,
                 "operations_by_type": {
-                    "open_long": open_long_count,
-                    "open_short": open_short_count,
-                    "close_position": close_position_count,
+                    "open_long": stats["open_long_count"],
+                    "open_short": stats["open_short_count"],
+                    "close_position": stats["close_position_count"],
                 },
                 "top_currencies": top_currencies,
             }
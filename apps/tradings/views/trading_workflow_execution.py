@@ -1,5 +1,7 @@
 """Trading Workflow Execution Views"""
 
+from django.db.models import Avg, Count, F, Func, IntegerField, Q, Sum
+
 from django_filters import rest_framework as filters
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -8,6 +10,8 @@ from rest_framework.response import Response
 from tradings.models import TradingWorkflowExecution
 from tradings.serializers import TradingWorkflowExecutionListSerializer, TradingWorkflowExecutionSerializer
 
+from core.paginators import LiteCursorPagination
+
 
 class TradingWorkflowExecutionFilter(filters.FilterSet):
     """
@@ -31,13 +35,16 @@ class TradingWorkflowExecutionFilter(filters.FilterSet):
     # Status filter
     status = filters.ChoiceFilter(choices=TradingWorkflowExecution.Status.choices)
 
-    # Currency filter (contains)
-    currency = filters.CharFilter(field_name="currencies", lookup_expr="contains")
+    # Currency filter (array containment, served by the GIN index)
+    currency = filters.CharFilter(method="filter_currency")
 
     class Meta:
         model = TradingWorkflowExecution
         fields = ["status", "start_date", "end_date", "date", "date_gte", "date_lte", "currency"]
 
+    def filter_currency(self, queryset, name, value):
+        return queryset.filter(currencies__contains=[value.upper()])
+
 
 class TradingWorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -46,6 +53,7 @@ class TradingWorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
     Provides:
     - List endpoint with filtering and pagination
     - Detail endpoint for individual executions
+    - Raw agent output / traceback endpoint (kept out of the detail payload)
     - Custom actions for statistics
 
     Query Parameters:
@@ -69,7 +77,41 @@ class TradingWorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [AllowAny]
     filterset_class = TradingWorkflowExecutionFilter
     ordering_fields = ["created_at", "execution_duration", "status"]
-    ordering = ["-created_at"]
+    ordering = ["-created_at", "-id"]
+    pagination_class = LiteCursorPagination
+
+    # Columns read by the list serializer (the summary uses the metric columns)
+    LIST_FIELDS = (
+        "id",
+        "created_at",
+        "updated_at",
+        "status",
+        "execution_duration",
+        "currencies",
+        "error_message",
+        "total_wallet_balance",
+        "available_balance",
+        "total_daily_pnl",
+        "trade_count",
+        "win_rate",
+    )
+
+    # Large text columns only served by the raw_output action
+    RAW_OUTPUT_FIELDS = ("agent_streaming_output", "error_traceback")
+
+    # Position count computed in Postgres, so list pages don't load and decode open_positions per row
+    SUMMARY_ANNOTATIONS = {
+        "open_positions_count": Func(F("open_positions"), function="jsonb_array_length", output_field=IntegerField()),
+    }
+
+    def get_queryset(self):
+        """Skip the large JSON/text columns when listing and annotate the position count instead."""
+        queryset = super().get_queryset()
+        if self.action == "list":
+            return queryset.only(*self.LIST_FIELDS).annotate(**self.SUMMARY_ANNOTATIONS)
+        if self.action == "raw_output":
+            return queryset.only("id", *self.RAW_OUTPUT_FIELDS)
+        return queryset.defer(*self.RAW_OUTPUT_FIELDS)
 
     def get_serializer_class(self):
         """Use lightweight serializer for list, full serializer for detail."""
@@ -77,6 +119,16 @@ class TradingWorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
             return TradingWorkflowExecutionListSerializer
         return TradingWorkflowExecutionSerializer
 
+    @action(detail=True, methods=["get"])
+    def raw_output(self, request, pk=None):
+        """
+        Get the full agent streaming output and error traceback of an execution.
+
+        These can be very large, so they are not part of the detail response.
+        """
+        execution = self.get_object()
+        return Response({field: getattr(execution, field) for field in self.RAW_OUTPUT_FIELDS})
+
     @action(detail=False, methods=["get"])
     def statistics(self, request):
         """
@@ -90,21 +142,20 @@ class TradingWorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
         """
         queryset = self.filter_queryset(self.get_queryset())
 
-        total_count = queryset.count()
-        success_count = queryset.filter(status=TradingWorkflowExecution.Status.SUCCESS).count()
-        error_count = queryset.filter(status=TradingWorkflowExecution.Status.ERROR).count()
-
-        # Calculate average execution duration
-        executions_with_duration = queryset.exclude(execution_duration__isnull=True)
-        avg_duration = None
-        if executions_with_duration.exists():
-            total_duration = sum(e.execution_duration for e in executions_with_duration)
-            avg_duration = total_duration / executions_with_duration.count()
-
-        # Calculate total daily PnL
-        total_pnl = 0.0
-        for execution in queryset.filter(status=TradingWorkflowExecution.Status.SUCCESS):
-            total_pnl += execution.daily_pnl.get("total_daily_pnl", 0)
+        # Single round-trip: counts, average duration and the PnL sum are all computed in Postgres
+        success = Q(status=TradingWorkflowExecution.Status.SUCCESS)
+        stats = queryset.order_by().aggregate(
+            total_count=Count("id"),
+            success_count=Count("id", filter=success),
+            error_count=Count("id", filter=Q(status=TradingWorkflowExecution.Status.ERROR)),
+            avg_duration=Avg("execution_duration"),
+            total_pnl=Sum("total_daily_pnl", filter=success),
+        )
+        total_count = stats["total_count"]
+        success_count = stats["success_count"]
+        error_count = stats["error_count"]
+        avg_duration = stats["avg_duration"]
+        total_pnl = stats["total_pnl"] or 0.0
 
         return Response(
             {
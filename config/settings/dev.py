@@ -2,5 +2,5 @@ from .base import *  # noqa
 
 # # MEDIA
 # ------------------------------------------------------------------------------
-MEDIA_ROOT = str(ROOT_DIR("media"))  # noqa
+MEDIA_ROOT = str(ROOT_DIR / "media")  # noqa
 MEDIA_URL = "/media/"
@@ -1,6 +1,6 @@
 """Base urls"""
 
-from django.contrib import admin
+from django.conf import settings
 from django.urls import include, path
 
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
@@ -9,7 +9,6 @@ from rest_framework_simplejwt.views import TokenBlacklistView, TokenObtainPairVi
 from config.views import HomePageView
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
     path("", HomePageView.as_view(), name="home"),
     path("", include(("tradings.urls", "tradings"))),
     path("", include(("accounts.urls", "accounts"))),
@@ -21,3 +20,8 @@ urlpatterns = [
     # path("docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     # path("redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
 ]
+
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
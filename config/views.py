@@ -6,9 +6,6 @@ class HomePageView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Get the current site URL from the request
-        request = self.request
-        scheme = "https" if request.is_secure() else "http"
-        host = request.get_host()
-        context["api_base_url"] = f"{scheme}://{host}"
+        # Current site URL (scheme + host) from the request
+        context["api_base_url"] = self.request.build_absolute_uri("/").rstrip("/")
         return context
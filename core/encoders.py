@@ -0,0 +1,26 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+import orjson
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONEncoder(DjangoJSONEncoder):
+    """
+    JSONField encoder backed by orjson.
+
+    Types orjson doesn't handle natively (Decimal, Promise, ...) fall back to
+    DjangoJSONEncoder.default.
+    """
+
+    def encode(self, o):
+        return orjson.dumps(o, default=self.default, option=ORJSON_OPTIONS).decode()
+
+
+class ORJSONDecoder(json.JSONDecoder):
+    """JSONField decoder backed by orjson."""
+
+    def decode(self, s, _w=None):
+        return orjson.loads(s)
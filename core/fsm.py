@@ -1,5 +1,7 @@
 import logging
 
+from django.db import transaction
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,9 +20,41 @@ class FiniteStateMachine:
     }
     """
 
+    # No per-instance storage of its own; non-model subclasses should declare
+    # __slots__ = ("state",) to avoid a __dict__ per instance, and call
+    # change_state(..., auto_save=False)
+    __slots__ = ()
+
     state_machine = None
     class_history = None
 
+    @classmethod
+    def _compiled(cls):
+        """
+        Build the transition and callback-name tables once per class.
+
+        Only the callback names are cached; they are resolved on the instance at
+        call time so static/class methods and instance attributes keep working.
+
+        @return {tuple} (transitions, before_callback_names, after_callback_names), each keyed by state
+        """
+        tables = cls.__dict__.get("_fsm_tables")
+        if tables is None:
+            state_machine = cls.state_machine or {}
+            transitions = {}
+            for state, next_states in state_machine.items():
+                if next_states == "__all__":
+                    next_states = state_machine.keys()
+                elif isinstance(next_states, str):
+                    next_states = (next_states,)
+                transitions[state] = frozenset(next_states or ())
+            states = set(state_machine).union(*transitions.values())
+            before = {state: "on_before_{0}_callback".format(state) for state in states}
+            after = {state: "on_{0}_callback".format(state) for state in states}
+            tables = (transitions, before, after)
+            cls._fsm_tables = tables
+        return tables
+
     def get_state(self):
         return self.state
 
@@ -30,27 +64,16 @@ class FiniteStateMachine:
 
         It uses the state_machine attribute in the class.
         """
-        valid_transitions = self.get_valid_transitions()
-
-        if not valid_transitions:
-            return False
-
-        return next_state in valid_transitions
+        return next_state in self.get_valid_transitions()
 
     def get_valid_transitions(self):
         """
         Return possible states to whom a product can transition.
 
-        @return {tuple/list}
+        @return {frozenset}
         """
-        current = self.get_state()
-
-        valid_transitions = self.state_machine.get(current)
-
-        if valid_transitions == "__all__":
-            return self.state_machine.keys()
-
-        return self.state_machine.get(current, ())
+        transitions, _, _ = self._compiled()
+        return transitions.get(self.get_state(), frozenset())
 
     def on_change_state(self, previous_state, next_state, **kwargs):
         """
@@ -70,26 +93,29 @@ class FiniteStateMachine:
         """
 
         current_state = self.get_state()
+        _, before_callbacks, after_callbacks = self._compiled()
 
         if self.can_change(next_state):
-            name = "on_before_{0}_callback".format(next_state)
-            callback = getattr(self, name, None)
+            callback = getattr(self, before_callbacks.get(next_state, ""), None)
             # record this change in historic
             if callback:
                 callback(**kwargs)
 
             self.state = next_state
             self.on_change_state(current_state, next_state, **kwargs)
-            if self.class_history:
-                self.create_history(**kwargs)
-            if auto_save:
-                self.save()
-                # This was added because in some cases, a Model is instanciated
-                # but not saved, and there are some operations that require
-                # the existance of the instance.
-
-            name = "on_{0}_callback".format(next_state)
-            callback = getattr(self, name, None)
+            if self.class_history or auto_save:
+                # History row and state update are committed together
+                with transaction.atomic():
+                    if self.class_history:
+                        self.create_history(**kwargs)
+                    if auto_save:
+                        # Full save: callbacks and on_change_state may have changed other fields
+                        self.save()
+                        # This was added because in some cases, a Model is instanciated
+                        # but not saved, and there are some operations that require
+                        # the existance of the instance.
+
+            callback = getattr(self, after_callbacks.get(next_state, ""), None)
             if callback:
                 callback(**kwargs)
         else:
@@ -0,0 +1,25 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueueStreamHandler(QueueHandler):
+    """
+    Logging handler that writes to stderr from a background thread.
+
+    Records are put on an in-memory queue by the logging thread and a QueueListener
+    writes them through a StreamHandler, so request and scheduler threads never block
+    on stderr. The configured formatter is applied by the StreamHandler.
+    """
+
+    def __init__(self):
+        super().__init__(queue.SimpleQueue())
+        self.stream_handler = logging.StreamHandler()
+        self.listener = QueueListener(self.queue, self.stream_handler)
+        self.listener.start()
+        # Flush whatever is still queued when the process exits
+        atexit.register(self.listener.stop)
+
+    def setFormatter(self, fmt):
+        self.stream_handler.setFormatter(fmt)
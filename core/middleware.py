@@ -0,0 +1,39 @@
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.backends.signals import connection_created
+
+# True while a request is being handled (contextvars follow sync_to_async/async_to_sync hops)
+_in_request = ContextVar("in_request", default=False)
+
+
+def _set_statement_timeout(sender, connection, **kwargs):
+    if _in_request.get() and connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET statement_timeout = %s", [settings.DB_STATEMENT_TIMEOUT_MS])
+
+
+class StatementTimeoutMiddleware:
+    """
+    Cap query run time on connections opened while handling a request.
+
+    Django connections are per thread, so a connection opened during a request is only
+    ever used by request handling. Connections opened elsewhere in the process (the
+    APScheduler trading workflow, management commands) keep Postgres' default of no
+    timeout. The timeout is set once when the connection is created, so persistent
+    connections don't pay an extra round trip per request.
+    """
+
+    def __init__(self, get_response):
+        if not settings.DB_STATEMENT_TIMEOUT_MS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        connection_created.connect(_set_statement_timeout, dispatch_uid="statement_timeout")
+
+    def __call__(self, request):
+        token = _in_request.set(True)
+        try:
+            return self.get_response(request)
+        finally:
+            _in_request.reset(token)
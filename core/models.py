@@ -1,8 +1,17 @@
+import functools
+
 from django.db import models
 
 
 class TimeStampedModel(models.Model):
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    """
+    Adds created_at/updated_at timestamps.
+
+    created_at is not indexed on its own; subclasses that filter or sort by it should
+    declare a composite index matching their queries in Meta.indexes.
+    """
+
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -39,4 +48,10 @@ class BaseHistory(models.Model):
         ), "'{}' should either include a `states_choices` attribute, ".format(
             self.__class__.__name__
         )
-        return dict(self.states_choices).get(self.state)
+        return self._states_map().get(self.state)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _states_map(cls):
+        """Map of state value to label, built once per history class."""
+        return dict(cls.states_choices)
@@ -1,6 +1,20 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class LitePagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "limit"
+
+
+class LiteCursorPagination(CursorPagination):
+    """
+    Keyset pagination for large, append-only tables.
+
+    Pages are fetched with ``WHERE created_at < <cursor>`` instead of ``OFFSET``, so
+    deep pages cost the same as the first one. ``id`` breaks ties between rows that
+    share a ``created_at``.
+    """
+
+    page_size = 20
+    page_size_query_param = "limit"
+    ordering = ("-created_at", "-id")
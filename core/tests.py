@@ -0,0 +1,93 @@
+"""
+Unit tests for the FiniteStateMachine mixin.
+"""
+
+from contextlib import nullcontext
+
+import pytest
+
+from core.fsm import FiniteStateMachine, WrongState
+
+
+class Job(FiniteStateMachine):
+    __slots__ = ("state", "calls", "on_done_callback")
+
+    state_machine = {
+        "pending": "running",
+        "running": ("done", "failed"),
+        "done": (),
+        "failed": "__all__",
+    }
+
+    def __init__(self, state="pending"):
+        self.state = state
+        self.calls = []
+
+    @staticmethod
+    def on_before_running_callback(**kwargs):
+        kwargs["log"].append("before_running")
+
+    @classmethod
+    def on_running_callback(cls, **kwargs):
+        kwargs["log"].append("running")
+
+
+class StoredJob(FiniteStateMachine):
+    """Stand-in model whose save() stores the requested columns in ``row``."""
+
+    __slots__ = ("state", "attempts", "row")
+
+    state_machine = {"pending": ("running",), "running": ()}
+
+    def __init__(self):
+        self.state = "pending"
+        self.attempts = 0
+        self.row = {"state": "pending", "attempts": 0}
+
+    def on_before_running_callback(self, **kwargs):
+        self.attempts += 1
+
+    def save(self, update_fields=None):
+        for field in update_fields or ("state", "attempts"):
+            self.row[field] = getattr(self, field)
+
+
+class TestFiniteStateMachine:
+    """Test suite for FiniteStateMachine.change_state."""
+
+    def test_single_string_target_is_one_state(self):
+        job = Job()
+
+        assert job.get_valid_transitions() == frozenset({"running"})
+        assert not job.can_change("r")
+
+    def test_static_and_class_method_callbacks_are_called(self):
+        job = Job()
+        log = []
+
+        job.change_state("running", auto_save=False, log=log)
+
+        assert job.state == "running"
+        assert log == ["before_running", "running"]
+
+    def test_callback_set_on_the_instance_is_called(self):
+        job = Job(state="running")
+        job.on_done_callback = lambda **kwargs: job.calls.append("done")
+
+        job.change_state("done", auto_save=False)
+
+        assert job.calls == ["done"]
+
+    def test_invalid_transition_raises(self):
+        job = Job(state="done")
+
+        with pytest.raises(WrongState):
+            job.change_state("running", auto_save=False)
+
+    def test_fields_changed_by_before_callback_are_saved(self, monkeypatch):
+        monkeypatch.setattr("core.fsm.transaction.atomic", nullcontext)
+        job = StoredJob()
+
+        job.change_state("running")
+
+        assert job.row == {"state": "running", "attempts": 1}
@@ -1,14 +1,23 @@
 import asyncio
+import functools
 from datetime import datetime
 
-from genflows.trading.workflow import TradingWorkflow
-from langfuse import get_client
-from openinference.instrumentation.llama_index import LlamaIndexInstrumentor
+
+@functools.cache
+def _instrument():
+    """Install the LlamaIndex instrumentation once per process."""
+    from openinference.instrumentation.llama_index import LlamaIndexInstrumentor
+
+    LlamaIndexInstrumentor().instrument()
 
 
 async def run_workflow():
+    # Heavy SDKs (LlamaIndex, OpenTelemetry, Langfuse) are only imported when the workflow actually runs
+    from genflows.trading.workflow import TradingWorkflow
+    from langfuse import get_client
+
     # Langfuse configuration
-    LlamaIndexInstrumentor().instrument()
+    _instrument()
     langfuse = get_client()
     trace_id = langfuse.create_trace_id()
     # pylint: disable=not-context-manager
@@ -8,9 +8,8 @@ real trades by analyzing how similar market conditions performed historically.
 from datetime import datetime, timedelta, timezone
 
 import pandas as pd
-from ta.momentum import RSIIndicator
-from ta.trend import MACD, EMAIndicator
-from ta.volatility import AverageTrueRange
+
+from services import indicators
 
 
 class BacktestService:
@@ -126,7 +125,7 @@ class BacktestService:
         Returns:
             pd.DataFrame: Historical data with calculated indicators.
         """
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.binance_client.symbol_for(currency)
 
         # Calculate how many 1-hour candles we need
         # Add extra buffer for indicator calculation warm-up
@@ -192,21 +191,18 @@ class BacktestService:
             pd.DataFrame: DataFrame with added indicator columns.
         """
         # EMA
-        df["ema_9"] = EMAIndicator(close=df["close"], window=9).ema_indicator()
-        df["ema_21"] = EMAIndicator(close=df["close"], window=21).ema_indicator()
+        df["ema_9"] = indicators.ema(df["close"], 9)
+        df["ema_21"] = indicators.ema(df["close"], 21)
 
         # MACD
-        macd = MACD(close=df["close"])
-        df["macd"] = macd.macd()
-        df["macd_signal"] = macd.macd_signal()
+        df["macd"], df["macd_signal"] = indicators.macd(df["close"])
 
         # RSI
-        df["rsi_7"] = RSIIndicator(close=df["close"], window=7).rsi()
-        df["rsi_14"] = RSIIndicator(close=df["close"], window=14).rsi()
+        df["rsi_7"] = indicators.rsi(df["close"], 7)
+        df["rsi_14"] = indicators.rsi(df["close"], 14)
 
         # ATR
-        atr = AverageTrueRange(high=df["high"], low=df["low"], close=df["close"], window=14)
-        df["atr_14"] = atr.average_true_range()
+        df["atr_14"] = indicators.atr(df["high"], df["low"], df["close"], 14)
 
         # Price position relative to EMA
         df["price_above_ema9"] = df["close"] > df["ema_9"]
@@ -1,11 +1,26 @@
 import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
-from ta.momentum import RSIIndicator
-from ta.trend import MACD, EMAIndicator
-from ta.volatility import AverageTrueRange
+
+from services import indicators
+
+# Closed klines from earlier _get_klines calls, keyed by (symbol, interval, limit). Kept at module
+# level because a new BinanceClient is created for every workflow run.
+_CLOSED_KLINES: dict[tuple[str, str, int], pd.DataFrame] = {}
+_CLOSED_KLINES_LOCK = threading.Lock()
+
+# Futures exchange info (symbols, filters, precisions) changes rarely; reuse it for an hour
+EXCHANGE_INFO_TTL = 3600
+_EXCHANGE_INFO: dict = {"fetched_at": 0.0, "data": None}
+_EXCHANGE_INFO_LOCK = threading.Lock()
 
 
 class BinanceClient:
@@ -20,6 +35,13 @@ class BinanceClient:
             raise ValueError("BINANCE_API_KEY and BINANCE_API_SECRET must be set in environment variables.")
 
         self.client = Client(api_key, api_secret)
+        # Shared pool for the independent HTTP requests issued by get_market_data
+        self._executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="binance")
+
+    @staticmethod
+    def symbol_for(currency: str) -> str:
+        """Return the USDT futures symbol for a currency (e.g., 'btc' -> 'BTCUSDT')."""
+        return f"{currency.upper()}USDT"
 
     def get_market_data(self, currency: str) -> dict:
         """
@@ -31,42 +53,49 @@ class BinanceClient:
         Returns:
             dict: A dictionary containing the aggregated market data.
         """
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
+
+        # The requests below are independent, so issue them all at once and collect them in order
+        ticker_future = self._executor.submit(self.client.get_symbol_ticker, symbol=symbol)
+        # 1h klines for current indicators; enough data for EMA(9), MACD(26, 12, 9), RSI(7)
+        klines_1h_future = self._executor.submit(self._get_klines, symbol, Client.KLINE_INTERVAL_1HOUR, 100)
+        klines_1d_future = self._executor.submit(self._get_klines, symbol, Client.KLINE_INTERVAL_1DAY, 100)
+        # Open Interest statistics (last 24 hours) and latest funding rate
+        oi_stats_future = self._executor.submit(
+            self.client.futures_open_interest_hist, symbol=symbol, period="1h", limit=24
+        )
+        funding_rate_future = self._executor.submit(self.client.futures_funding_rate, symbol=symbol, limit=1)
 
         # 1. Fetch Current Snapshot
-        ticker = self.client.get_symbol_ticker(symbol=symbol)
+        ticker = ticker_future.result()
         current_price = float(ticker["price"])
 
-        # Fetch recent klines for current indicators (using 1h interval for "current" context)
-        # We need enough data for EMA(9), MACD(26, 12, 9), RSI(7)
-        klines_1h = self._get_klines(symbol, Client.KLINE_INTERVAL_1HOUR, limit=100)
-        df_1h = self._calculate_indicators(klines_1h)
+        # Current indicators (using 1h interval for "current" context)
+        df_1h = self._calculate_indicators(klines_1h_future.result())
 
         current_ema_9 = df_1h["ema_9"].iloc[-1]
         current_macd = df_1h["macd"].iloc[-1]
         current_rsi_7 = df_1h["rsi_7"].iloc[-1]
 
         # 2. Fetch Perpetual Futures Metrics
-        futures_metrics = self._get_futures_metrics(symbol)
+        futures_metrics = self._get_futures_metrics(oi_stats_future, funding_rate_future)
 
         # 3. Intraday Series (1h interval)
         # We want the series data. Let's take the last 10 points for the "series" display.
         series_length = 10
-        intraday_series = {
-            "prices": df_1h["close"].tail(series_length).tolist(),
-            "ema_9": df_1h["ema_9"].tail(series_length).tolist(),
-            "macd": df_1h["macd"].tail(series_length).tolist(),
-            "rsi_7": df_1h["rsi_7"].tail(series_length).tolist(),
-            "rsi_14": df_1h["rsi_14"].tail(series_length).tolist(),
-        }
+        # One slice of the needed columns, converted to Python lists column by column
+        prices, ema_9, macd, rsi_7, rsi_14 = (
+            df_1h[["close", "ema_9", "macd", "rsi_7", "rsi_14"]].to_numpy()[-series_length:].T.tolist()
+        )
+        intraday_series = {"prices": prices, "ema_9": ema_9, "macd": macd, "rsi_7": rsi_7, "rsi_14": rsi_14}
 
         # 4. Longer-term Context (1d interval)
-        klines_1d = self._get_klines(symbol, Client.KLINE_INTERVAL_1DAY, limit=100)
-        df_1d = self._calculate_indicators(klines_1d)
+        df_1d = self._calculate_indicators(klines_1d_future.result())
 
         current_vol = df_1d["volume"].iloc[-1]
         avg_vol = df_1d["volume"].mean()  # Simple average of the fetched period
 
+        macd_long, rsi_14_long = df_1d[["macd", "rsi_14"]].to_numpy()[-series_length:].T.tolist()
         long_term_context = {
             "ema_9": df_1d["ema_9"].iloc[-1],
             "ema_21": df_1d["ema_21"].iloc[-1],
@@ -74,8 +103,8 @@ class BinanceClient:
             "atr_28": df_1d["atr_28"].iloc[-1],
             "current_volume": current_vol,
             "average_volume": avg_vol,
-            "macd_series": df_1d["macd"].tail(series_length).tolist(),
-            "rsi_14_series": df_1d["rsi_14"].tail(series_length).tolist(),
+            "macd_series": macd_long,
+            "rsi_14_series": rsi_14_long,
         }
 
         # Construct the final dictionary
@@ -105,10 +134,42 @@ class BinanceClient:
         }
 
     def _get_klines(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
+        """
+        Return the latest ``limit`` klines as a DataFrame.
+
+        Closed candles never change, so they are kept between calls (and between runs) and
+        only the candles opened since the last closed one are fetched and appended.
+        """
+        key = (symbol, interval, limit)
+        with _CLOSED_KLINES_LOCK:
+            closed = _CLOSED_KLINES.get(key)
+
+        df = None
+        if closed is not None and not closed.empty:
+            recent = self._fetch_klines(
+                symbol, interval, limit=limit, start_time=int(closed["close_time"].iloc[-1]) + 1
+            )
+            # A full page means more candles than we keep have opened since; refetch from scratch
+            if len(recent) < limit:
+                df = pd.concat([closed, recent], ignore_index=True).tail(limit).reset_index(drop=True)
+        if df is None:
+            df = self._fetch_klines(symbol, interval, limit=limit)
+
+        # Small margin so a candle is only cached once Binance has finalized it
+        closed_before = time.time() * 1000 - 5000
+        with _CLOSED_KLINES_LOCK:
+            _CLOSED_KLINES[key] = df[df["close_time"] < closed_before].reset_index(drop=True)
+
+        return df
+
+    def _fetch_klines(self, symbol: str, interval: str, limit: int, start_time: int = None) -> pd.DataFrame:
         """
         Fetch historical klines and return as a DataFrame.
         """
-        klines = self.client.get_klines(symbol=symbol, interval=interval, limit=limit)
+        params = {"symbol": symbol, "interval": interval, "limit": limit}
+        if start_time is not None:
+            params["startTime"] = start_time
+        klines = self.client.get_klines(**params)
         df = pd.DataFrame(
             klines,
             columns=[
@@ -127,9 +188,9 @@ class BinanceClient:
             ],
         )
 
-        # Convert numeric columns
+        # Binance returns prices/volumes as strings; cast the columns in one vectorized pass
         numeric_cols = ["open", "high", "low", "close", "volume"]
-        df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, axis=1)
+        df[numeric_cols] = df[numeric_cols].astype("float64")
 
         return df
 
@@ -138,43 +199,41 @@ class BinanceClient:
         Calculate technical indicators (EMA, MACD, RSI, ATR).
         """
         # EMA
-        df["ema_9"] = EMAIndicator(close=df["close"], window=9).ema_indicator()
-        df["ema_21"] = EMAIndicator(close=df["close"], window=21).ema_indicator()
+        df["ema_9"] = indicators.ema(df["close"], 9)
+        df["ema_21"] = indicators.ema(df["close"], 21)
 
         # MACD (12, 26, 9)
-        macd = MACD(close=df["close"])
-        df["macd"] = macd.macd()
+        df["macd"], _ = indicators.macd(df["close"])
 
         # RSI
-        df["rsi_7"] = RSIIndicator(close=df["close"], window=7).rsi()
-        df["rsi_14"] = RSIIndicator(close=df["close"], window=14).rsi()
+        df["rsi_7"] = indicators.rsi(df["close"], 7)
+        df["rsi_14"] = indicators.rsi(df["close"], 14)
 
         # ATR
-        atr_14 = AverageTrueRange(high=df["high"], low=df["low"], close=df["close"], window=14)
-        df["atr_14"] = atr_14.average_true_range()
-
-        atr_28 = AverageTrueRange(high=df["high"], low=df["low"], close=df["close"], window=28)
-        df["atr_28"] = atr_28.average_true_range()
+        df["atr_14"] = indicators.atr(df["high"], df["low"], df["close"], 14)
+        df["atr_28"] = indicators.atr(df["high"], df["low"], df["close"], 28)
 
         return df
 
-    def _get_futures_metrics(self, symbol: str) -> dict:
+    def _get_futures_metrics(self, oi_stats_future: Future, funding_rate_future: Future) -> dict:
         """
-        Fetch Futures Open Interest and Funding Rate.
+        Build Futures Open Interest and Funding Rate metrics from the in-flight requests.
         """
         try:
             # Open Interest
-            # Fetching Open Interest Statistics (last 24 hours)
-            oi_stats = self.client.futures_open_interest_hist(symbol=symbol, period="1h", limit=24)
+            oi_stats = oi_stats_future.result()
 
             if not oi_stats:
                 return {"oi_latest": 0, "oi_average": 0, "funding_rate": 0}
 
-            latest_oi = float(oi_stats[-1]["sumOpenInterest"])
-            avg_oi = sum(float(x["sumOpenInterest"]) for x in oi_stats) / len(oi_stats)
+            oi_values = np.fromiter(
+                (x["sumOpenInterest"] for x in oi_stats), dtype=np.float64, count=len(oi_stats)
+            )
+            latest_oi = float(oi_values[-1])
+            avg_oi = float(oi_values.mean())
 
             # Funding Rate
-            funding_rate_info = self.client.futures_funding_rate(symbol=symbol, limit=1)
+            funding_rate_info = funding_rate_future.result()
             funding_rate = float(funding_rate_info[-1]["fundingRate"]) * 100 if funding_rate_info else 0.0
 
             return {"oi_latest": latest_oi, "oi_average": avg_oi, "funding_rate": funding_rate}
@@ -194,7 +253,7 @@ class BinanceClient:
         Returns:
             bool: True if successful, False otherwise.
         """
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
         try:
             self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
             print(f"Leverage set to {leverage}x for {symbol}")
@@ -203,55 +262,47 @@ class BinanceClient:
             print(f"Error setting leverage: {e}")
             return False
 
-    def _place_stop_loss(self, symbol: str, side: str, quantity: float, stop_price: float) -> dict:
+    def _place_protective_orders(
+        self, symbol: str, side: str, quantity: float, stop_price: float, tp_price: float = None
+    ) -> tuple[dict, dict]:
         """
-        Place a Stop Loss order.
+        Place the Stop Loss and optional Take Profit orders in a single batch request.
 
         Args:
             symbol: Trading pair symbol
             side: 'SELL' for long positions, 'BUY' for short positions
             quantity: Position quantity
             stop_price: Stop loss trigger price
-        """
-        try:
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type="STOP_MARKET",
-                stopPrice=stop_price,
-                quantity=quantity,
-                closePosition=False,
-            )
-            print(f"Stop Loss placed at ${stop_price:.2f}")
-            return order
-        except BinanceAPIException as e:
-            print(f"Error placing Stop Loss: {e}")
-            return {"error": str(e)}
+            tp_price: Take profit trigger price (optional)
 
-    def _place_take_profit(self, symbol: str, side: str, quantity: float, tp_price: float) -> dict:
+        Returns:
+            tuple: (stop loss order, take profit order or None). Orders rejected by Binance are
+                   returned as {"error": message}.
         """
-        Place a Take Profit order.
+        # Values are sent as strings, as the batch endpoint expects; each order in the batch is
+        # accepted or rejected on its own
+        base_order = {"symbol": symbol, "side": side, "quantity": str(quantity)}
+        orders = [{**base_order, "type": "STOP_MARKET", "stopPrice": str(stop_price)}]
+        if tp_price:
+            orders.append({**base_order, "type": "TAKE_PROFIT_MARKET", "stopPrice": str(tp_price)})
 
-        Args:
-            symbol: Trading pair symbol
-            side: 'SELL' for long positions, 'BUY' for short positions
-            quantity: Position quantity
-            tp_price: Take profit trigger price
-        """
         try:
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type="TAKE_PROFIT_MARKET",
-                stopPrice=tp_price,
-                quantity=quantity,
-                closePosition=False,
-            )
-            print(f"Take Profit placed at ${tp_price:.2f}")
-            return order
+            responses = self.client.futures_place_batch_order(batchOrders=orders)
         except BinanceAPIException as e:
-            print(f"Error placing Take Profit: {e}")
-            return {"error": str(e)}
+            print(f"Error placing Stop Loss/Take Profit: {e}")
+            error = {"error": str(e)}
+            return error, error if tp_price else None
+
+        placed = []
+        for label, price, response in zip(("Stop Loss", "Take Profit"), (stop_price, tp_price), responses):
+            if "orderId" in response:
+                print(f"{label} placed at ${price:.2f}")
+                placed.append(response)
+            else:
+                print(f"Error placing {label}: {response.get('msg')}")
+                placed.append({"error": response.get("msg", str(response))})
+
+        return placed[0], placed[1] if tp_price else None
 
     def open_long_position(
         self,
@@ -281,7 +332,7 @@ class BinanceClient:
         if stop_loss_price is None:
             raise ValueError("stop_loss_price is required. Cannot open a long position without a stop loss.")
 
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
 
         # Set leverage if specified
         if leverage:
@@ -295,14 +346,15 @@ class BinanceClient:
 
         result = {"main_order_id": main_order.get("orderId"), "symbol": symbol, "side": "LONG", "quantity": quantity}
 
-        # Place Stop Loss (now mandatory)
-        sl_order = self._place_stop_loss(symbol, Client.SIDE_SELL, quantity, stop_loss_price)
+        # Place Stop Loss (now mandatory) and Take Profit if specified, in one request
+        sl_order, tp_order = self._place_protective_orders(
+            symbol, Client.SIDE_SELL, quantity, stop_loss_price, take_profit_price
+        )
         result["stop_loss_order_id"] = sl_order.get("orderId")
         result["stop_loss_price"] = stop_loss_price
 
         # Place Take Profit if specified
-        if take_profit_price:
-            tp_order = self._place_take_profit(symbol, Client.SIDE_SELL, quantity, take_profit_price)
+        if tp_order:
             result["take_profit_order_id"] = tp_order.get("orderId")
             result["take_profit_price"] = take_profit_price
 
@@ -336,7 +388,7 @@ class BinanceClient:
         if stop_loss_price is None:
             raise ValueError("stop_loss_price is required. Cannot open a short position without a stop loss.")
 
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
 
         # Set leverage if specified
         if leverage:
@@ -350,14 +402,15 @@ class BinanceClient:
 
         result = {"main_order_id": main_order.get("orderId"), "symbol": symbol, "side": "SHORT", "quantity": quantity}
 
-        # Place Stop Loss (now mandatory)
-        sl_order = self._place_stop_loss(symbol, Client.SIDE_BUY, quantity, stop_loss_price)
+        # Place Stop Loss (now mandatory) and Take Profit if specified, in one request
+        sl_order, tp_order = self._place_protective_orders(
+            symbol, Client.SIDE_BUY, quantity, stop_loss_price, take_profit_price
+        )
         result["stop_loss_order_id"] = sl_order.get("orderId")
         result["stop_loss_price"] = stop_loss_price
 
         # Place Take Profit if specified (BUY for short positions)
-        if take_profit_price:
-            tp_order = self._place_take_profit(symbol, Client.SIDE_BUY, quantity, take_profit_price)
+        if tp_order:
             result["take_profit_order_id"] = tp_order.get("orderId")
             result["take_profit_price"] = take_profit_price
 
@@ -376,12 +429,25 @@ class BinanceClient:
             print(f"Error placing order: {e}")
             return {"error": str(e)}
 
+    def get_current_price(self, currency: str) -> float:
+        """
+        Get the latest price for a currency.
+
+        Args:
+            currency (str): The currency symbol (e.g., 'BTC').
+
+        Returns:
+            float: Latest price in USDT.
+        """
+        ticker = self.client.get_symbol_ticker(symbol=self.symbol_for(currency))
+        return float(ticker["price"])
+
     def get_open_position(self, currency: str) -> float:
         """
         Get the current open position amount for a currency.
         Positive = Long, Negative = Short, 0 = No position.
         """
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
         try:
             positions = self.client.futures_position_information(symbol=symbol)
             for p in positions:
@@ -401,7 +467,7 @@ class BinanceClient:
             print(f"No open position for {currency}.")
             return {"status": "NO_POSITION"}
 
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
         side = Client.SIDE_SELL if amount > 0 else Client.SIDE_BUY
         quantity = abs(amount)
 
@@ -423,6 +489,11 @@ class BinanceClient:
             # Fetch all open orders once to avoid multiple API calls
             all_orders = self.client.futures_get_open_orders()
 
+            # Group orders by symbol in a single pass
+            orders_by_symbol = defaultdict(list)
+            for order in all_orders:
+                orders_by_symbol[order["symbol"]].append(order)
+
             open_positions = []
 
             for p in positions:
@@ -431,7 +502,7 @@ class BinanceClient:
                     symbol = p["symbol"]
 
                     # Filter orders for this symbol
-                    symbol_orders = [o for o in all_orders if o["symbol"] == symbol]
+                    symbol_orders = orders_by_symbol.get(symbol, [])
 
                     # Categorize orders by type
                     stop_loss_orders = []
@@ -532,6 +603,19 @@ class BinanceClient:
                 "assets": [],
             }
 
+    def get_exchange_info(self) -> dict:
+        """
+        Get the futures exchange info, cached for EXCHANGE_INFO_TTL seconds.
+
+        Returns:
+            dict: Raw response of futures_exchange_info.
+        """
+        with _EXCHANGE_INFO_LOCK:
+            if _EXCHANGE_INFO["data"] is None or time.monotonic() - _EXCHANGE_INFO["fetched_at"] > EXCHANGE_INFO_TTL:
+                _EXCHANGE_INFO["data"] = self.client.futures_exchange_info()
+                _EXCHANGE_INFO["fetched_at"] = time.monotonic()
+            return _EXCHANGE_INFO["data"]
+
     def get_available_futures_symbols(self, quote_asset: str = "USDT") -> list:
         """
         Get all available futures trading symbols.
@@ -543,7 +627,7 @@ class BinanceClient:
             list: List of dictionaries with symbol information.
         """
         try:
-            exchange_info = self.client.futures_exchange_info()
+            exchange_info = self.get_exchange_info()
             symbols = []
 
             for symbol_info in exchange_info.get("symbols", []):
@@ -600,9 +684,11 @@ class BinanceClient:
                 # Group by symbol
                 symbols_with_orders = set(order["symbol"] for order in all_orders)
 
-                # Cancel for each symbol
-                for sym in symbols_with_orders:
-                    result = self.client.futures_cancel_all_open_orders(symbol=sym)
+                # Cancel for each symbol; the requests are independent, so they run on the shared pool
+                results = self._executor.map(
+                    lambda sym: self.client.futures_cancel_all_open_orders(symbol=sym), symbols_with_orders
+                )
+                for sym, result in zip(symbols_with_orders, results):
                     cancelled_orders.append({"symbol": sym, "result": result})
                     print(f"✓ Cancelled all open orders for {sym}")
 
@@ -625,18 +711,13 @@ class BinanceClient:
                   total daily PnL, and trade count.
         """
         try:
-            # Get income history (realized PnL)
-            income = self.client.futures_income_history(incomeType="REALIZED_PNL", limit=100)
+            today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            today_start = int(today_start.timestamp() * 1000)
 
-            # Filter today's trades
-            from datetime import datetime, timezone
-
-            today_start = (
-                datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0).timestamp() * 1000
-            )
-
-            today_trades = [i for i in income if i["time"] >= today_start]
-            today_realized_pnl = sum(float(i["income"]) for i in today_trades)
+            # Get today's income history (realized PnL), filtered by Binance
+            income = self.client.futures_income_history(incomeType="REALIZED_PNL", startTime=today_start, limit=1000)
+            pnl_values = np.fromiter((i["income"] for i in income), dtype=np.float64, count=len(income))
+            today_realized_pnl = float(pnl_values.sum())
 
             # Get unrealized PnL from open positions if requested
             unrealized_pnl = 0
@@ -648,8 +729,8 @@ class BinanceClient:
             total_daily_pnl = today_realized_pnl + unrealized_pnl
 
             # Calculate win rate
-            winning_trades = sum(1 for i in today_trades if float(i["income"]) > 0)
-            total_trades = len(today_trades)
+            winning_trades = int((pnl_values > 0).sum())
+            total_trades = len(pnl_values)
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
 
             return {
@@ -684,7 +765,7 @@ class BinanceClient:
         Returns:
             list: Recent trades with execution details and PnL.
         """
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
         try:
             trades = self.client.futures_account_trades(symbol=symbol, limit=limit)
 
@@ -719,21 +800,25 @@ class BinanceClient:
         Returns:
             dict: Order book with bid/ask levels and volumes.
         """
-        symbol = f"{currency.upper()}USDT"
+        symbol = self.symbol_for(currency)
         try:
             depth = self.client.futures_order_book(symbol=symbol, limit=limit)
 
+            # (price, quantity) levels as float arrays; reshape keeps an empty side two-dimensional
+            bids = np.asarray(depth["bids"], dtype=np.float64).reshape(-1, 2)
+            asks = np.asarray(depth["asks"], dtype=np.float64).reshape(-1, 2)
+
             # Calculate total volumes
-            bid_volume = sum(float(q) for _, q in depth["bids"])
-            ask_volume = sum(float(q) for _, q in depth["asks"])
+            bid_volume = float(bids[:, 1].sum())
+            ask_volume = float(asks[:, 1].sum())
 
             # Get top 5 levels for display
-            top_bids = [(float(p), float(q)) for p, q in depth["bids"][:5]]
-            top_asks = [(float(p), float(q)) for p, q in depth["asks"][:5]]
+            top_bids = list(map(tuple, bids[:5].tolist()))
+            top_asks = list(map(tuple, asks[:5].tolist()))
 
             # Calculate spread
-            best_bid = float(depth["bids"][0][0]) if depth["bids"] else 0
-            best_ask = float(depth["asks"][0][0]) if depth["asks"] else 0
+            best_bid = float(bids[0, 0]) if len(bids) else 0
+            best_ask = float(asks[0, 0]) if len(asks) else 0
             spread = best_ask - best_bid
             spread_percentage = (spread / best_bid * 100) if best_bid > 0 else 0
 
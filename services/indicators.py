@@ -0,0 +1,58 @@
+"""
+Technical indicators computed with vectorized pandas/numpy operations.
+
+Values match the ``ta`` library (EMA, MACD, RSI with Wilder smoothing, ATR), so they
+can be swapped in without changing what the agent sees.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def ema(close: pd.Series, window: int) -> pd.Series:
+    """Exponential moving average (NaN until ``window`` values are available)."""
+    return close.ewm(span=window, min_periods=window, adjust=False).mean()
+
+
+def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple[pd.Series, pd.Series]:
+    """
+    MACD line and its signal line.
+
+    Returns:
+        tuple: (macd, macd_signal)
+    """
+    macd_line = ema(close, fast) - ema(close, slow)
+    return macd_line, ema(macd_line, signal)
+
+
+def rsi(close: pd.Series, window: int) -> pd.Series:
+    """Relative Strength Index with Wilder smoothing."""
+    diff = close.diff(1)
+    up = diff.where(diff > 0, 0.0)
+    down = -diff.where(diff < 0, 0.0)
+    avg_up = up.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    avg_down = down.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    rsi_values = np.where(avg_down == 0, 100, 100 - (100 / (1 + avg_up / avg_down)))
+    return pd.Series(rsi_values, index=close.index)
+
+
+def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int) -> pd.Series:
+    """
+    Average True Range with Wilder smoothing.
+
+    Seeded with the simple mean of the first ``window`` true ranges; earlier values are 0.
+    """
+    prev_close = close.shift(1).to_numpy()
+    high_values = high.to_numpy(dtype=float)
+    low_values = low.to_numpy(dtype=float)
+    # fmax ignores the NaN previous close on the first row, like ta's DataFrame.max
+    true_range = np.fmax(
+        high_values - low_values, np.fmax(np.abs(high_values - prev_close), np.abs(low_values - prev_close))
+    )
+
+    atr_values = np.zeros(len(true_range))
+    if len(true_range) >= window:
+        smoothed = pd.Series(true_range[window - 1:])
+        smoothed.iloc[0] = true_range[:window].mean()
+        atr_values[window - 1:] = smoothed.ewm(alpha=1 / window, adjust=False).mean().to_numpy()
+    return pd.Series(atr_values, index=close.index)
@@ -0,0 +1,90 @@
+"""Helpers shared by the manual trading scripts."""
+
+import functools
+import os
+import select
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_CEILING, Decimal
+
+
+@functools.lru_cache(maxsize=1)
+def _exchange_filters(client) -> dict:
+    """
+    Fetch the futures exchange info once and index each symbol's filters by type.
+
+    Returns:
+        dict: {symbol: {filterType: filter}}
+    """
+    info = client.get_exchange_info()
+    return {s["symbol"]: {f["filterType"]: f for f in s["filters"]} for s in info["symbols"]}
+
+
+def get_min_quantity(client, currency):
+    """
+    Fetch the minimum quantity allowed for the currency's symbol, accounting for MIN_NOTIONAL.
+
+    Returns:
+        tuple: (required quantity, current price)
+    """
+    # The price request doesn't depend on the exchange info, so it runs while the filters load
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        price_future = executor.submit(client.get_current_price, currency)
+        filters = _exchange_filters(client).get(client.symbol_for(currency), {})
+        current_price = price_future.result()
+
+    # Binance sends these as decimal strings; Decimal keeps them exact so rounding never adds a spurious step
+    lot_size = filters.get("LOT_SIZE", {})
+    min_qty = Decimal(lot_size.get("minQty", "0.001"))
+    step_size = Decimal(lot_size.get("stepSize", "0.001"))
+    min_notional = Decimal(filters.get("MIN_NOTIONAL", {}).get("notional", "100"))  # Default minimum notional in USDT
+
+    # str() keeps the price's shortest decimal repr instead of its binary expansion
+    price = Decimal(str(current_price))
+
+    # Calculate quantity needed to meet min_notional
+    qty_for_notional = min_notional / price
+
+    # Use the larger of min_qty or qty_for_notional
+    required_qty = max(min_qty, qty_for_notional)
+
+    # Round up to the nearest step_size
+    required_qty = float((required_qty / step_size).to_integral_value(rounding=ROUND_CEILING) * step_size)
+
+    return required_qty, current_price
+
+
+def wait_for_position(client, currency, is_open, timeout=10.0, interval=0.5):
+    """
+    Poll the position for a currency until it is open (or closed), up to ``timeout`` seconds.
+
+    Returns:
+        float: The last position amount seen.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        position = client.get_open_position(currency)
+        if (position != 0) == is_open or time.monotonic() >= deadline:
+            return position
+        time.sleep(interval)
+
+
+def countdown(seconds=5):
+    """
+    Give the user ``seconds`` to cancel with Ctrl+C; pressing Enter starts right away.
+
+    Falls back to a plain sleep where stdin can't be polled (Windows, no TTY).
+    """
+    if os.name == "nt" or not sys.stdin.isatty():
+        print(f"You have {seconds} seconds to cancel (Ctrl+C)...")
+        time.sleep(seconds)
+        return
+
+    for remaining in range(seconds, 0, -1):
+        print(f"Starting in {remaining}s (Enter to start now, Ctrl+C to cancel)...", end="\r", flush=True)
+        ready, _, _ = select.select([sys.stdin], [], [], 1.0)
+        if ready:
+            sys.stdin.readline()
+            break
+    print()
@@ -1,11 +1,5 @@
-import os
-import sys
-
 from dotenv import load_dotenv
 
-# Add parent directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
-
 from services.binance_client import BinanceClient
 
 
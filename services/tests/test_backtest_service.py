@@ -16,12 +16,12 @@ from services.backtest_service import BacktestService
 class TestBacktestService:
     """Test suite for BacktestService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def binance_client(self):
-        """Create a BinanceClient instance for testing."""
+        """Create a BinanceClient instance shared by the tests in this class."""
         return BinanceClient()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def backtest_service(self, binance_client):
         """Create a BacktestService instance for testing."""
         return BacktestService(binance_client)
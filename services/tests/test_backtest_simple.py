@@ -1,22 +1,17 @@
 """
 Simple test script for BacktestService.
-Run with: python test_backtest_simple.py
+Run from the project root with: python -m services.tests.test_backtest_simple
 """
 
-import os
 import sys
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-# Load environment variables from .env file
 from dotenv import load_dotenv
-load_dotenv(project_root / ".env")
 
-from services.binance_client import BinanceClient
 from services.backtest_service import BacktestService
+from services.binance_client import BinanceClient
+
+# Load environment variables from .env file
+load_dotenv()
 
 
 def test_backtest():
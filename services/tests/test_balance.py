@@ -1,12 +1,7 @@
-import os
-import sys
-
 from dotenv import load_dotenv
 
 from services.binance_client import BinanceClient
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 
 def main():
     load_dotenv()
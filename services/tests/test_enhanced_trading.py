@@ -1,62 +1,19 @@
-import os
-import sys
-import time
-
 from dotenv import load_dotenv
 
 from services.binance_client import BinanceClient
-
-# Add parent directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
-
-
-def get_min_quantity(client, symbol):
-    """
-    Fetch the minimum quantity allowed for the symbol, accounting for MIN_NOTIONAL.
-    """
-    info = client.client.futures_exchange_info()
-    min_qty = 0.001
-    min_notional = 100
-    step_size = 0.001
-
-    for s in info["symbols"]:
-        if s["symbol"] == symbol:
-            for filter in s["filters"]:
-                if filter["filterType"] == "LOT_SIZE":
-                    min_qty = float(filter["minQty"])
-                    step_size = float(filter["stepSize"])
-                elif filter["filterType"] == "MIN_NOTIONAL":
-                    min_notional = float(filter["notional"])
-
-    # Get current price
-    ticker = client.client.get_symbol_ticker(symbol=symbol)
-    current_price = float(ticker["price"])
-
-    # Calculate quantity needed to meet min_notional
-    qty_for_notional = min_notional / current_price
-
-    # Use the larger of min_qty or qty_for_notional
-    required_qty = max(min_qty, qty_for_notional)
-
-    # Round up to the nearest step_size
-    import math
-
-    required_qty = math.ceil(required_qty / step_size) * step_size
-
-    return required_qty, current_price
+from services.tests._common import countdown, get_min_quantity, wait_for_position
 
 
 def main():
     load_dotenv()
 
     print("WARNING: This script will execute REAL TRADES with SL/TP.")
-    print("You have 5 seconds to cancel (Ctrl+C)...")
-    time.sleep(5)
+    countdown(5)
 
     try:
         client = BinanceClient()
         currency = "BTC"
-        symbol = f"{currency}USDT"
+        symbol = client.symbol_for(currency)
 
         # Check for existing position
         initial_pos = client.get_open_position(currency)
@@ -65,7 +22,7 @@ def main():
             return
 
         # Get Min Quantity and current price
-        min_qty, current_price = get_min_quantity(client, symbol)
+        min_qty, current_price = get_min_quantity(client, currency)
         print(f"Current Price: ${current_price:.2f}")
         print(f"Minimum quantity for {symbol}: {min_qty}")
 
@@ -99,11 +56,8 @@ def main():
             print(f"Take Profit Price: ${result.get('take_profit_price'):.2f}")
 
         # Wait and verify
-        print("\nWaiting 3 seconds...")
-        time.sleep(3)
-
-        # Check position
-        current_pos = client.get_open_position(currency)
+        print("\nWaiting for the position to open...")
+        current_pos = wait_for_position(client, currency, is_open=True)
         print(f"Current Position: {current_pos}")
 
         if current_pos == 0:
@@ -120,8 +74,7 @@ def main():
         print("\nClosing position...")
         client.close_position(currency)
 
-        time.sleep(2)
-        final_pos = client.get_open_position(currency)
+        final_pos = wait_for_position(client, currency, is_open=False)
         print(f"Final Position: {final_pos}")
 
         if final_pos == 0:
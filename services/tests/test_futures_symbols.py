@@ -1,8 +1,4 @@
-import os
-import sys
-
-# Add parent directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+from operator import itemgetter
 
 from dotenv import load_dotenv
 
@@ -17,15 +13,16 @@ def main():
         print("Fetching available Futures symbols...\n")
 
         symbols = client.get_available_futures_symbols(quote_asset="USDT")
+        by_symbol = {s["symbol"]: s for s in symbols}
 
         print(f"Found {len(symbols)} USDT perpetual futures contracts:\n")
 
         # Display first 20 symbols
         print("First 20 symbols:")
+        symbol_fields = itemgetter("symbol", "base_asset", "price_precision", "quantity_precision")
+        symbol_line = "{:2d}. {:15s} - {:10s} (Price: {} decimals, Qty: {} decimals)".format
         for i, symbol_info in enumerate(symbols[:20], 1):
-            print(
-                f"{i:2d}. {symbol_info['symbol']:15s} - {symbol_info['base_asset']:10s} (Price: {symbol_info['price_precision']} decimals, Qty: {symbol_info['quantity_precision']} decimals)"
-            )
+            print(symbol_line(i, *symbol_fields(symbol_info)))
 
         if len(symbols) > 20:
             print(f"\n... and {len(symbols) - 20} more symbols")
@@ -34,7 +31,7 @@ def main():
         popular = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "ADAUSDT"]
         print("\n\nPopular symbols:")
         for pop in popular:
-            found = next((s for s in symbols if s["symbol"] == pop), None)
+            found = by_symbol.get(pop)
             if found:
                 print(f"  {found['symbol']:15s} - {found['base_asset']:10s}")
 